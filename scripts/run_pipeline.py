@@ -33,6 +33,12 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to .env file.",
     )
+    parser.add_argument(
+        "--write-csv",
+        action="store_true",
+        default=None,
+        help="Also write a CSV copy of the final dataset (default from WRITE_CSV).",
+    )
     return parser.parse_args()
 
 
@@ -43,11 +49,13 @@ def main() -> None:
         output_dir=args.output_dir,
         llm_provider=args.llm_provider,
         env_file=args.env_file,
+        write_csv=args.write_csv,
     )
     print("Pipeline completed.")
     print(f"Run ID: {result.run_id}")
-    print(f"CSV: {result.output_csv}")
     print(f"Parquet: {result.output_parquet}")
+    if result.output_csv is not None:
+        print(f"CSV: {result.output_csv}")
     print(f"Run metadata: {result.run_metadata}")
 
 
@@ -18,6 +18,12 @@ def main() -> None:
         help="Optional LLM provider override.",
     )
     parser.add_argument("--env-file", default=None, help="Optional .env file path.")
+    parser.add_argument(
+        "--write-csv",
+        action="store_true",
+        default=None,
+        help="Also write a CSV copy of the final dataset (default from WRITE_CSV).",
+    )
     args = parser.parse_args()
 
     result = run_pipeline(
@@ -25,10 +31,12 @@ def main() -> None:
         output_dir=args.output_dir,
         llm_provider=args.llm_provider,
         env_file=args.env_file,
+        write_csv=args.write_csv,
     )
     print(f"Run complete: {result.run_id}")
-    print(f"CSV: {result.output_csv}")
     print(f"Parquet: {result.output_parquet}")
+    if result.output_csv is not None:
+        print(f"CSV: {result.output_csv}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+"""Helpers for driving coroutines from synchronous entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion, tolerating an already active event loop."""
+    try:
+        return asyncio.run(coro)
+    except RuntimeError as exc:
+        # Supports environments where an event loop is already active.
+        if "asyncio.run() cannot be called from a running event loop" not in str(exc):
+            raise
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
@@ -0,0 +1,208 @@
+"""On-disk caches that let reruns and recovery skip repeated network calls."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+import orjson
+
+# Stay well below SQLite's host-parameter limit for `IN (...)` lookups.
+_SQLITE_MAX_PARAMS = 900
+
+
+class CrossrefCache:
+    """SQLite-backed `doi -> Crossref message` cache with a time-to-live."""
+
+    def __init__(self, path: Path, ttl_seconds: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS crossref ("
+            "doi TEXT PRIMARY KEY, metadata BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "CrossrefCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, dois: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return cached metadata for DOIs fetched within the TTL window."""
+        keys = list(dois)
+        found: dict[str, dict[str, Any]] = {}
+        if not keys or self.ttl_seconds <= 0:
+            return found
+
+        oldest = int(time.time()) - self.ttl_seconds
+        for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+            chunk = keys[start : start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT doi, metadata FROM crossref WHERE fetched_at >= ? AND doi IN ({placeholders})",
+                (oldest, *chunk),
+            )
+            for doi, blob in rows:
+                found[doi] = orjson.loads(blob)
+        return found
+
+    def put_many(self, metadata_by_doi: dict[str, dict[str, Any]]) -> None:
+        """Insert or refresh metadata for successfully resolved DOIs."""
+        if not metadata_by_doi:
+            return
+        now = int(time.time())
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO crossref (doi, metadata, fetched_at) VALUES (?, ?, ?)",
+            [(doi, orjson.dumps(metadata), now) for doi, metadata in metadata_by_doi.items()],
+        )
+        self._conn.commit()
+
+
+class LLMResponseCache:
+    """SQLite-backed `cache key -> raw LLM response` store shared across threads."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            self._conn.commit()
+
+
+class LLMResponseStore:
+    """
+    SQLite store of structured LLM responses, keyed by content-addressed response key.
+
+    Replaces one JSON file per response plus a JSON `record_id -> key` index:
+    lookups are primary-key reads and the index lives in its own table. WAL with
+    `synchronous=NORMAL` keeps per-response commits cheap while still surviving
+    an interrupted run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "response_key TEXT PRIMARY KEY, record_id TEXT, source_id TEXT, provider TEXT, "
+            "model TEXT, structured BLOB NOT NULL, raw_response TEXT, processed_at_utc TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS record_index ("
+            "record_id TEXT PRIMARY KEY, response_key TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "LLMResponseStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, response_key: str) -> dict[str, Any] | None:
+        """Return the stored structured payload for `response_key`, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT structured FROM responses WHERE response_key = ?",
+                (response_key,),
+            ).fetchone()
+        return None if row is None else orjson.loads(row[0])
+
+    def put(
+        self,
+        response_key: str,
+        structured: dict[str, Any],
+        *,
+        record_id: str,
+        source_id: Any,
+        provider: str,
+        model: str,
+        raw_response: str,
+    ) -> None:
+        """Insert or replace the response stored under `response_key`."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (response_key, record_id, source_id, provider, "
+                "model, structured, raw_response, processed_at_utc) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    response_key,
+                    record_id,
+                    None if source_id is None else str(source_id),
+                    provider,
+                    model,
+                    orjson.dumps(structured, option=orjson.OPT_SERIALIZE_NUMPY),
+                    raw_response,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            self._conn.commit()
+
+    def index_records(self, mapping: dict[str, str]) -> None:
+        """Point each `record_id` at the response key it was last served from."""
+        if not mapping:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO record_index (record_id, response_key) VALUES (?, ?)",
+                list(mapping.items()),
+            )
+            self._conn.commit()
+
+    def response_keys_for(self, record_ids: Iterable[str]) -> dict[str, str]:
+        """Return `record_id -> response_key` for indexed records."""
+        ids = list(record_ids)
+        found: dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(ids), _SQLITE_MAX_PARAMS):
+                chunk = ids[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT record_id, response_key FROM record_index "
+                    f"WHERE record_id IN ({placeholders})",
+                    chunk,
+                )
+                found.update(rows)
+        return found
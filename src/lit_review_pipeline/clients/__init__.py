@@ -1,7 +1,8 @@
 """Client implementations for LLM providers."""
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, HTTPLLMClient
+from .cached_client import CachedLLMClient
 from .gemini_client import GeminiClient
 from .openai_client import OpenAIClient
 
-__all__ = ["BaseLLMClient", "GeminiClient", "OpenAIClient"]
+__all__ = ["BaseLLMClient", "CachedLLMClient", "GeminiClient", "HTTPLLMClient", "OpenAIClient"]
@@ -2,7 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
+from typing import Any, Mapping, Sequence
+
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Settings
+from .key_pool import APIKeyPool
+from .rate_limiter import RateLimiter
+
+LOGGER = logging.getLogger(__name__)
+
+# Rate limiting and transient server-side failures are retried; other 4xx are not.
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
 
 
 class BaseLLMClient(ABC):
@@ -21,3 +39,203 @@ class BaseLLMClient(ABC):
     @abstractmethod
     def generate(self, prompt: str) -> str:
         """Generate text output for a prompt."""
+
+    @abstractmethod
+    async def agenerate(self, prompt: str) -> str:
+        """Asynchronously generate text output for a prompt."""
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether `generate_batch` submits prompts as a provider-side batch job."""
+        return False
+
+    def generate_batch(self, prompts: list[str]) -> list[str | Exception]:
+        """
+        Generate outputs for many prompts in one provider batch job.
+
+        Results are positionally aligned with `prompts`; per-prompt failures are
+        returned as exception instances rather than raised.
+        """
+        raise NotImplementedError(f"{self.provider} does not support batch generation")
+
+    async def aprewarm(self) -> None:
+        """Open provider connections ahead of the first real request."""
+
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+
+    async def aclose(self) -> None:
+        """Release pooled async connections bound to the running event loop."""
+
+
+def _estimate_tokens(prompt: str) -> int:
+    """Rough prompt size for TPM budgeting (~4 characters per token)."""
+    return len(prompt) // 4
+
+
+class HTTPLLMClient(BaseLLMClient):
+    """
+    Shared transport for JSON-over-HTTPS providers.
+
+    Subclasses describe a request with `_build_request`, authenticate it with
+    `_auth_headers` and decode the provider payload with `_parse_response`;
+    pooling, key rotation and bounded retries live here.
+    """
+
+    PREWARM_URL: str = ""
+
+    def __init__(self, settings: Settings, api_keys: Sequence[str]) -> None:
+        self._keys = APIKeyPool(api_keys)
+        # Provider quotas apply per key, so the shared budget scales with the pool.
+        self._limiter = RateLimiter(
+            rpm=settings.llm_rpm * len(self._keys),
+            tpm=settings.llm_tpm * len(self._keys),
+        )
+        self._timeout = settings.llm_request_timeout_seconds
+        self._temperature = settings.llm_temperature
+        self._max_output_tokens = settings.llm_max_output_tokens
+        self._max_retries = max(1, settings.llm_max_retries)
+        self._retry_base_delay = settings.llm_retry_base_delay
+        self._batch_poll_seconds = settings.llm_batch_poll_seconds
+        self._batch_timeout_seconds = settings.llm_batch_timeout_seconds
+
+        self._session = requests.Session()
+        self._session.headers.update(self._default_headers())
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=settings.llm_max_workers,
+                pool_maxsize=settings.llm_max_workers * 2,
+                max_retries=0,
+            ),
+        )
+        self._aclient: httpx.AsyncClient | None = None
+
+    @abstractmethod
+    def _build_request(self, prompt: str) -> tuple[str, dict[str, Any]]:
+        """Return the endpoint URL and JSON payload for a prompt."""
+
+    @abstractmethod
+    def _parse_response(self, data: dict[str, Any]) -> str:
+        """Extract generated text from a decoded provider response."""
+
+    @abstractmethod
+    def _auth_headers(self, api_key: str) -> dict[str, str]:
+        """Return per-request authentication headers for `api_key`."""
+
+    def _default_headers(self) -> dict[str, str]:
+        return {"Content-Type": "application/json"}
+
+    def generate(self, prompt: str) -> str:
+        url, payload = self._build_request(prompt)
+        body = orjson.dumps(payload)
+        tokens = _estimate_tokens(prompt)
+        for attempt in range(1, self._max_retries + 1):
+            self._limiter.acquire(tokens)
+            key = self._keys.next_key()
+            try:
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers=self._auth_headers(key),
+                    timeout=self._timeout,
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self._max_retries:
+                    self._log_failure(response.status_code, key, attempt)
+                    response.raise_for_status()
+                    return self._parse_response(orjson.loads(response.content))
+                self._log_failure(response.status_code, key, attempt)
+                if self._rotate_on_rate_limit(response.status_code, response.headers, key, attempt):
+                    continue
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self._max_retries:
+                    raise
+                LOGGER.warning("%s request failed (attempt %s): %s", self.provider, attempt, exc)
+            time.sleep(self._backoff(attempt))
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def agenerate(self, prompt: str) -> str:
+        url, payload = self._build_request(prompt)
+        body = orjson.dumps(payload)
+        client = self._async_client()
+        tokens = _estimate_tokens(prompt)
+        for attempt in range(1, self._max_retries + 1):
+            await self._limiter.aacquire(tokens)
+            key = self._keys.next_key()
+            try:
+                response = await client.post(url, content=body, headers=self._auth_headers(key))
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self._max_retries:
+                    self._log_failure(response.status_code, key, attempt)
+                    response.raise_for_status()
+                    return self._parse_response(orjson.loads(response.content))
+                self._log_failure(response.status_code, key, attempt)
+                if self._rotate_on_rate_limit(response.status_code, response.headers, key, attempt):
+                    continue
+            except httpx.TransportError as exc:
+                if attempt == self._max_retries:
+                    raise
+                LOGGER.warning("%s request failed (attempt %s): %s", self.provider, attempt, exc)
+            await asyncio.sleep(self._backoff(attempt))
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _log_failure(self, status_code: int, key: str, attempt: int) -> None:
+        if status_code >= 400:
+            LOGGER.warning(
+                "%s returned HTTP %s (attempt %s, key %s)",
+                self.provider,
+                status_code,
+                attempt,
+                APIKeyPool.label(key),
+            )
+
+    def _rotate_on_rate_limit(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        key: str,
+        attempt: int,
+    ) -> bool:
+        """Cool down a rate-limited key; return True when another key can retry immediately."""
+        if status_code != 429:
+            return False
+        retry_after = headers.get("Retry-After", "")
+        try:
+            cooldown = float(retry_after)
+        except ValueError:
+            cooldown = self._retry_delay(attempt)
+        self._keys.cooldown(key, cooldown)
+        return len(self._keys) > 1 and self._keys.seconds_until_available() == 0
+
+    async def aprewarm(self) -> None:
+        if not self.PREWARM_URL:
+            return
+        try:
+            await self._async_client().head(self.PREWARM_URL, timeout=5)
+        except httpx.HTTPError as exc:  # Best effort only; real calls retry on their own.
+            LOGGER.debug("%s prewarm failed: %s", self.provider, exc)
+
+    def close(self) -> None:
+        self._session.close()
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential retry delay, stretched until some key is out of its 429 cooldown."""
+        return max(self._retry_delay(attempt), self._keys.seconds_until_available())
+
+    def _retry_delay(self, attempt: int) -> float:
+        return self._retry_base_delay * (2 ** (attempt - 1))
+
+    def _async_client(self) -> httpx.AsyncClient:
+        # Created lazily so the connection pool binds to the running event loop.
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                headers=self._default_headers(),
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            )
+        return self._aclient
@@ -0,0 +1,89 @@
+"""Response-caching decorator for LLM clients."""
+
+from __future__ import annotations
+
+import hashlib
+
+from ..cache import LLMResponseCache
+from .base import BaseLLMClient
+
+
+class CachedLLMClient(BaseLLMClient):
+    """
+    Wrap another client and reuse stored responses for identical prompts.
+
+    Keys cover provider, model, temperature and the full prompt text, so a model
+    or template change never replays a stale answer. With `refresh=True` lookups
+    are skipped but fresh responses are still stored.
+    """
+
+    def __init__(
+        self,
+        wrapped: BaseLLMClient,
+        cache: LLMResponseCache,
+        *,
+        temperature: float,
+        refresh: bool = False,
+    ) -> None:
+        self._wrapped = wrapped
+        self._cache = cache
+        self._temperature = temperature
+        self._refresh = refresh
+
+    @property
+    def provider(self) -> str:
+        return self._wrapped.provider
+
+    @property
+    def model(self) -> str:
+        return self._wrapped.model
+
+    def cache_key(self, prompt: str) -> str:
+        raw = f"{self.provider}|{self.model}|{self._temperature}|{prompt}"
+        return hashlib.blake2b(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def generate(self, prompt: str) -> str:
+        key = self.cache_key(prompt)
+        cached = None if self._refresh else self._cache.get(key)
+        if cached is not None:
+            return cached
+        response = self._wrapped.generate(prompt)
+        self._cache.put(key, response)
+        return response
+
+    async def agenerate(self, prompt: str) -> str:
+        key = self.cache_key(prompt)
+        cached = None if self._refresh else self._cache.get(key)
+        if cached is not None:
+            return cached
+        response = await self._wrapped.agenerate(prompt)
+        self._cache.put(key, response)
+        return response
+
+    @property
+    def supports_batch(self) -> bool:
+        return self._wrapped.supports_batch
+
+    def generate_batch(self, prompts: list[str]) -> list[str | Exception]:
+        keys = [self.cache_key(prompt) for prompt in prompts]
+        results: list[str | Exception | None] = [
+            None if self._refresh else self._cache.get(key) for key in keys
+        ]
+        misses = [idx for idx, result in enumerate(results) if result is None]
+        if misses:
+            fresh = self._wrapped.generate_batch([prompts[idx] for idx in misses])
+            for idx, response in zip(misses, fresh):
+                results[idx] = response
+                if isinstance(response, str):
+                    self._cache.put(keys[idx], response)
+        return results  # type: ignore[return-value]
+
+    async def aprewarm(self) -> None:
+        await self._wrapped.aprewarm()
+
+    def close(self) -> None:
+        self._wrapped.close()
+        self._cache.close()
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
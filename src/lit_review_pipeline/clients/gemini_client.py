@@ -2,22 +2,22 @@
 
 from __future__ import annotations
 
-import requests
+from typing import Any
 
 from ..config import Settings
-from .base import BaseLLMClient
+from .base import HTTPLLMClient
 
 
-class GeminiClient(BaseLLMClient):
+class GeminiClient(HTTPLLMClient):
     """Gemini REST API client using a JSON request contract."""
 
+    PREWARM_URL = "https://generativelanguage.googleapis.com/"
+
     def __init__(self, settings: Settings) -> None:
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required when LLM_PROVIDER=gemini")
-        self._api_key = settings.gemini_api_key
+        if not settings.gemini_api_keys:
+            raise ValueError("GEMINI_API_KEY(S) is required when LLM_PROVIDER=gemini")
         self._model = settings.gemini_model
-        self._timeout = settings.llm_request_timeout_seconds
-        self._temperature = settings.llm_temperature
+        super().__init__(settings, api_keys=settings.gemini_api_keys)
 
     @property
     def provider(self) -> str:
@@ -27,10 +27,10 @@ class GeminiClient(BaseLLMClient):
     def model(self) -> str:
         return self._model
 
-    def generate(self, prompt: str) -> str:
+    def _build_request(self, prompt: str) -> tuple[str, dict[str, Any]]:
         url = (
             f"https://generativelanguage.googleapis.com/v1beta/models/"
-            f"{self._model}:generateContent?key={self._api_key}"
+            f"{self._model}:generateContent"
         )
         payload = {
             "contents": [
@@ -40,21 +40,23 @@ class GeminiClient(BaseLLMClient):
             ],
             "generationConfig": {
                 "temperature": self._temperature,
+                "maxOutputTokens": self._max_output_tokens,
             },
         }
-        response = requests.post(url, json=payload, timeout=self._timeout)
-        response.raise_for_status()
-        data = response.json()
-
-        candidates = data.get("candidates", [])
-        if not candidates:
-            raise ValueError("Gemini response contained no candidates.")
-
-        parts = candidates[0].get("content", {}).get("parts", [])
-        if not parts:
-            raise ValueError("Gemini response contained no text parts.")
-
-        text = "".join(part.get("text", "") for part in parts if isinstance(part, dict)).strip()
+        return url, payload
+
+    def _auth_headers(self, api_key: str) -> dict[str, str]:
+        return {"x-goog-api-key": api_key}
+
+    def _parse_response(self, data: dict[str, Any]) -> str:
+        try:
+            parts = data["candidates"][0]["content"]["parts"]
+            text = "".join(part["text"] for part in parts).strip()
+        except (KeyError, IndexError, TypeError) as exc:
+            feedback = data.get("promptFeedback") if isinstance(data, dict) else None
+            block_reason = feedback.get("blockReason") if isinstance(feedback, dict) else None
+            detail = f"prompt blocked ({block_reason})" if block_reason else "no text parts"
+            raise ValueError(f"Gemini response malformed: {detail}.") from exc
         if not text:
             raise ValueError("Gemini response text was empty.")
         return text
@@ -0,0 +1,49 @@
+"""Round-robin API key rotation with per-key rate-limit cooldowns."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Sequence
+
+
+class APIKeyPool:
+    """Hand out provider keys in rotation, skipping keys that were recently rate limited."""
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        if not keys:
+            raise ValueError("APIKeyPool requires at least one key.")
+        self._keys: deque[str] = deque(dict.fromkeys(keys))
+        self._cooldown_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def next_key(self) -> str:
+        """Return the next key not cooling down, or the one that recovers soonest."""
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self._keys)):
+                key = self._keys[0]
+                self._keys.rotate(-1)
+                if self._cooldown_until.get(key, 0.0) <= now:
+                    return key
+            return min(self._keys, key=lambda k: self._cooldown_until.get(k, 0.0))
+
+    def cooldown(self, key: str, seconds: float) -> None:
+        """Exclude `key` from rotation for `seconds` (e.g. after HTTP 429)."""
+        with self._lock:
+            self._cooldown_until[key] = time.monotonic() + max(0.0, seconds)
+
+    def seconds_until_available(self) -> float:
+        """Time until some key leaves cooldown; 0 when one is usable now."""
+        with self._lock:
+            soonest = min(self._cooldown_until.get(key, 0.0) for key in self._keys)
+            return max(0.0, soonest - time.monotonic())
+
+    @staticmethod
+    def label(key: str) -> str:
+        """Short, log-safe identifier for a key."""
+        return f"...{key[-4:]}"
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+import logging
+import time
+from typing import Any
+
+import orjson
 import requests
 
 from ..config import Settings
-from .base import BaseLLMClient
+from .base import HTTPLLMClient
+
+LOGGER = logging.getLogger(__name__)
+
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 
-class OpenAIClient(BaseLLMClient):
+class OpenAIClient(HTTPLLMClient):
     """OpenAI chat completions API client."""
 
+    API_BASE = "https://api.openai.com/v1"
+    URL = f"{API_BASE}/chat/completions"
+    PREWARM_URL = "https://api.openai.com/"
+
     def __init__(self, settings: Settings) -> None:
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-        self._api_key = settings.openai_api_key
+        if not settings.openai_api_keys:
+            raise ValueError("OPENAI_API_KEY(S) is required when LLM_PROVIDER=openai")
         self._model = settings.openai_model
-        self._timeout = settings.llm_request_timeout_seconds
-        self._temperature = settings.llm_temperature
+        super().__init__(settings, api_keys=settings.openai_api_keys)
 
     @property
     def provider(self) -> str:
@@ -27,15 +38,119 @@ class OpenAIClient(BaseLLMClient):
     def model(self) -> str:
         return self._model
 
-    def generate(self, prompt: str) -> str:
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
+    def _auth_headers(self, api_key: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {api_key}"}
+
+    @property
+    def supports_batch(self) -> bool:
+        return True
+
+    def generate_batch(self, prompts: list[str]) -> list[str | Exception]:
+        """Run prompts through the OpenAI Batch API (`/v1/batches`) and wait for results."""
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(idx),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_request(prompt)[1],
+                }
+            )
+            for idx, prompt in enumerate(prompts)
+        ]
+        # Files and batches are scoped to the key's organization, so one key
+        # must own the whole job from upload to download.
+        auth = self._auth_headers(self._keys.next_key())
+        upload = self._session.post(
+            f"{self.API_BASE}/files",
+            # Drop the session JSON content type so requests emits multipart.
+            headers={**auth, "Content-Type": None},
+            data={"purpose": "batch"},
+            files={"file": ("batch_input.jsonl", b"\n".join(lines), "application/jsonl")},
+            timeout=self._timeout,
+        )
+        upload.raise_for_status()
+
+        created = self._session.post(
+            f"{self.API_BASE}/batches",
+            data=orjson.dumps(
+                {
+                    "input_file_id": orjson.loads(upload.content)["id"],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h",
+                }
+            ),
+            headers=auth,
+            timeout=self._timeout,
+        )
+        created.raise_for_status()
+        batch = orjson.loads(created.content)
+        LOGGER.info("OpenAI batch %s submitted with %s requests", batch["id"], len(prompts))
+
+        deadline = time.monotonic() + self._batch_timeout_seconds
+        while batch.get("status") not in _BATCH_TERMINAL_STATES:
+            if time.monotonic() >= deadline:
+                self._cancel_batch(batch["id"], auth)
+                raise TimeoutError(
+                    f"OpenAI batch {batch['id']} still {batch.get('status')} after "
+                    f"{self._batch_timeout_seconds:.0f}s; cancelled"
+                )
+            time.sleep(self._batch_poll_seconds)
+            polled = self._session.get(
+                f"{self.API_BASE}/batches/{batch['id']}",
+                headers=auth,
+                timeout=self._timeout,
+            )
+            polled.raise_for_status()
+            batch = orjson.loads(polled.content)
+
+        results: list[str | Exception] = [
+            RuntimeError(f"OpenAI batch {batch['id']} returned no result (status: {batch.get('status')})")
+            for _ in prompts
+        ]
+        for file_key in ("output_file_id", "error_file_id"):
+            if batch.get(file_key):
+                for line in self._download_file(batch[file_key], auth).splitlines():
+                    if line.strip():
+                        idx, outcome = self._parse_batch_line(orjson.loads(line))
+                        results[idx] = outcome
+        return results
+
+    def _cancel_batch(self, batch_id: str, auth: dict[str, str]) -> None:
+        try:
+            self._session.post(
+                f"{self.API_BASE}/batches/{batch_id}/cancel",
+                headers=auth,
+                timeout=self._timeout,
+            ).raise_for_status()
+        except requests.RequestException as exc:  # Best effort; the timeout is raised regardless.
+            LOGGER.warning("Could not cancel OpenAI batch %s: %s", batch_id, exc)
+
+    def _download_file(self, file_id: str, auth: dict[str, str]) -> bytes:
+        response = self._session.get(
+            f"{self.API_BASE}/files/{file_id}/content",
+            headers=auth,
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        return response.content
+
+    def _parse_batch_line(self, line: dict[str, Any]) -> tuple[int, str | Exception]:
+        idx = int(line["custom_id"])
+        response = line.get("response") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            detail = line.get("error") or response.get("body")
+            return idx, RuntimeError(f"OpenAI batch request failed: {detail}")
+        try:
+            return idx, self._parse_response(response["body"])
+        except ValueError as exc:
+            return idx, exc
+
+    def _build_request(self, prompt: str) -> tuple[str, dict[str, Any]]:
         payload = {
             "model": self._model,
             "temperature": self._temperature,
+            "max_tokens": self._max_output_tokens,
             "messages": [
                 {
                     "role": "system",
@@ -44,16 +159,13 @@ class OpenAIClient(BaseLLMClient):
                 {"role": "user", "content": prompt},
             ],
         }
-        response = requests.post(url, headers=headers, json=payload, timeout=self._timeout)
-        response.raise_for_status()
-        data = response.json()
-
-        choices = data.get("choices", [])
-        if not choices:
-            raise ValueError("OpenAI response contained no choices.")
+        return self.URL, payload
 
-        message = choices[0].get("message", {})
-        content = message.get("content", "")
+    def _parse_response(self, data: dict[str, Any]) -> str:
+        try:
+            content = data["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:
+            raise ValueError("OpenAI response malformed: no message content.") from exc
         if not content:
             raise ValueError("OpenAI response content was empty.")
-        return content.strip()
+        return content
@@ -0,0 +1,75 @@
+"""Proactive request/token throttling shared by sync and async LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class _TokenBucket:
+    """Per-minute budget refilled continuously at `per_minute / 60` units per second."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = per_minute
+        self.level = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def shortfall_seconds(self, amount: float) -> float:
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter over requests per minute and tokens per minute.
+
+    Callers reserve budget before sending, so concurrent workers queue locally
+    instead of all hitting the provider and being throttled with 429s. A limit
+    of 0 disables that bucket.
+    """
+
+    def __init__(self, rpm: float, tpm: float) -> None:
+        now = time.monotonic()
+        self._requests = _TokenBucket(rpm, now) if rpm > 0 else None
+        self._tokens = _TokenBucket(tpm, now) if tpm > 0 else None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block the calling thread until one request and `tokens` tokens are available."""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Wait on the event loop until one request and `tokens` tokens are available."""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take the budget and return 0, or return how long to wait before retrying."""
+        if not self.enabled:
+            return 0.0
+        demands = [
+            (bucket, min(float(amount), bucket.capacity))
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens))
+            if bucket is not None
+        ]
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for bucket, amount in demands:
+                bucket.refill(now)
+                wait = max(wait, bucket.shortfall_seconds(amount))
+            if wait > 0:
+                return wait
+            for bucket, amount in demands:
+                bucket.level -= amount
+            return 0.0
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -21,89 +22,158 @@ def _as_int(value: str | None, default: int) -> int:
     return int(value)
 
 
+def _as_list(value: str | None) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
 def _as_float(value: str | None, default: float) -> float:
     if value is None or value.strip() == "":
         return default
     return float(value)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Runtime settings loaded from environment variables."""
+    """
+    Runtime settings loaded from environment variables.
+
+    Instances are immutable so a cached instance can be shared safely; derive
+    overrides with `dataclasses.replace`, which also recomputes derived paths.
+    """
 
     output_dir: Path
     log_level: str
     seed: int
     prompt_template_path: Path
+    batch_prompt_template_path: Path
     overwrite_existing_responses: bool
+    llm_cache_enabled: bool
+    write_csv: bool
+    preprocess_workers: int
 
     doi_concurrency: int
     doi_timeout_seconds: int
     doi_max_retries: int
     doi_retry_base_delay: float
+    doi_cache_ttl_days: int
 
     llm_provider: str
     llm_max_workers: int
     llm_request_timeout_seconds: int
     llm_temperature: float
-
-    gemini_api_key: str
+    llm_max_output_tokens: int
+    llm_max_retries: int
+    llm_retry_base_delay: float
+    llm_batch_mode: bool
+    llm_batch_poll_seconds: float
+    llm_batch_timeout_seconds: float
+    llm_rows_per_prompt: int
+    llm_rpm: int
+    llm_tpm: int
+
+    gemini_api_keys: tuple[str, ...]
     gemini_model: str
 
-    openai_api_key: str
+    openai_api_keys: tuple[str, ...]
     openai_model: str
 
+    logs_dir: Path = field(init=False, repr=False, compare=False)
+    cache_dir: Path = field(init=False, repr=False, compare=False)
+    doi_metadata_dir: Path = field(init=False, repr=False, compare=False)
+    crossref_cache_path: Path = field(init=False, repr=False, compare=False)
+    llm_cache_path: Path = field(init=False, repr=False, compare=False)
+    llm_response_store_path: Path = field(init=False, repr=False, compare=False)
+    failed_doi_log_path: Path = field(init=False, repr=False, compare=False)
+    failed_llm_log_path: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        logs_dir = self.output_dir / "logs"
+        cache_dir = self.output_dir / "cache"
+        derived = {
+            "logs_dir": logs_dir,
+            "cache_dir": cache_dir,
+            "doi_metadata_dir": self.output_dir / "doi_metadata",
+            "crossref_cache_path": cache_dir / "crossref.sqlite",
+            "llm_cache_path": cache_dir / "llm.sqlite",
+            "llm_response_store_path": self.output_dir / "llm_responses.sqlite",
+            "failed_doi_log_path": logs_dir / "failed_doi_log.ndjson",
+            "failed_llm_log_path": logs_dir / "failed_llm_log.json",
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
     @classmethod
     def from_env(cls, env_file: str | Path | None = None) -> "Settings":
-        """Create settings from process environment and optional .env file."""
-        load_dotenv(dotenv_path=env_file)
-
-        output_dir = Path(os.getenv("OUTPUT_DIR", "output"))
-        return cls(
-            output_dir=output_dir,
-            log_level=os.getenv("PIPELINE_LOG_LEVEL", "INFO"),
-            seed=_as_int(os.getenv("PIPELINE_SEED"), 42),
-            prompt_template_path=Path(
-                os.getenv("PROMPT_TEMPLATE_PATH", "prompts/abstract_structuring_prompt.txt")
-            ),
-            overwrite_existing_responses=_as_bool(
-                os.getenv("OVERWRITE_EXISTING_RESPONSES"),
-                default=False,
-            ),
-            doi_concurrency=_as_int(os.getenv("DOI_CONCURRENCY"), 20),
-            doi_timeout_seconds=_as_int(os.getenv("DOI_TIMEOUT_SECONDS"), 30),
-            doi_max_retries=_as_int(os.getenv("DOI_MAX_RETRIES"), 3),
-            doi_retry_base_delay=_as_float(os.getenv("DOI_RETRY_BASE_DELAY"), 1.5),
-            llm_provider=os.getenv("LLM_PROVIDER", "gemini").strip().lower(),
-            llm_max_workers=_as_int(os.getenv("LLM_MAX_WORKERS"), 8),
-            llm_request_timeout_seconds=_as_int(
-                os.getenv("LLM_REQUEST_TIMEOUT_SECONDS"),
-                60,
-            ),
-            llm_temperature=_as_float(os.getenv("LLM_TEMPERATURE"), 0.0),
-            gemini_api_key=os.getenv("GEMINI_API_KEY", "").strip(),
-            gemini_model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash").strip(),
-            openai_api_key=os.getenv("OPENAI_API_KEY", "").strip(),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip(),
-        )
-
-    @property
-    def logs_dir(self) -> Path:
-        return self.output_dir / "logs"
-
-    @property
-    def llm_responses_dir(self) -> Path:
-        return self.output_dir / "llm_responses"
-
-    @property
-    def failed_doi_log_path(self) -> Path:
-        return self.logs_dir / "failed_doi_log.json"
-
-    @property
-    def failed_llm_log_path(self) -> Path:
-        return self.logs_dir / "failed_llm_log.json"
+        """
+        Create settings from process environment and optional .env file.
+
+        Results are cached per `env_file`; call `Settings.clear_env_cache()` to
+        pick up environment changes made after the first call.
+        """
+        return _settings_from_env(str(env_file) if env_file is not None else None)
+
+    @staticmethod
+    def clear_env_cache() -> None:
+        _settings_from_env.cache_clear()
 
     def ensure_directories(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.llm_responses_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.doi_metadata_dir.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=8)
+def _settings_from_env(env_file: str | None) -> Settings:
+    load_dotenv(dotenv_path=env_file)
+
+    output_dir = Path(os.getenv("OUTPUT_DIR", "output"))
+    return Settings(
+        output_dir=output_dir,
+        log_level=os.getenv("PIPELINE_LOG_LEVEL", "INFO"),
+        seed=_as_int(os.getenv("PIPELINE_SEED"), 42),
+        prompt_template_path=Path(
+            os.getenv("PROMPT_TEMPLATE_PATH", "prompts/abstract_structuring_prompt.txt")
+        ),
+        batch_prompt_template_path=Path(
+            os.getenv("BATCH_PROMPT_TEMPLATE_PATH", "prompts/abstract_structuring_batch_prompt.txt")
+        ),
+        overwrite_existing_responses=_as_bool(
+            os.getenv("OVERWRITE_EXISTING_RESPONSES"),
+            default=False,
+        ),
+        llm_cache_enabled=_as_bool(os.getenv("LLM_CACHE_ENABLED"), default=False),
+        write_csv=_as_bool(os.getenv("WRITE_CSV"), default=False),
+        preprocess_workers=_as_int(os.getenv("PREPROCESS_WORKERS"), 1) or (os.cpu_count() or 1),
+        doi_concurrency=_as_int(os.getenv("DOI_CONCURRENCY"), 20),
+        doi_timeout_seconds=_as_int(os.getenv("DOI_TIMEOUT_SECONDS"), 30),
+        doi_max_retries=_as_int(os.getenv("DOI_MAX_RETRIES"), 3),
+        doi_retry_base_delay=_as_float(os.getenv("DOI_RETRY_BASE_DELAY"), 1.5),
+        doi_cache_ttl_days=_as_int(os.getenv("DOI_CACHE_TTL_DAYS"), 30),
+        llm_provider=os.getenv("LLM_PROVIDER", "gemini").strip().lower(),
+        llm_max_workers=_as_int(os.getenv("LLM_MAX_WORKERS"), 8),
+        llm_request_timeout_seconds=_as_int(
+            os.getenv("LLM_REQUEST_TIMEOUT_SECONDS"),
+            60,
+        ),
+        llm_temperature=_as_float(os.getenv("LLM_TEMPERATURE"), 0.0),
+        llm_max_output_tokens=_as_int(os.getenv("LLM_MAX_OUTPUT_TOKENS"), 2048),
+        llm_max_retries=_as_int(os.getenv("LLM_MAX_RETRIES"), 3),
+        llm_retry_base_delay=_as_float(os.getenv("LLM_RETRY_BASE_DELAY"), 1.5),
+        llm_batch_mode=_as_bool(os.getenv("LLM_BATCH_MODE"), default=False),
+        llm_batch_poll_seconds=_as_float(os.getenv("LLM_BATCH_POLL_SECONDS"), 30.0),
+        llm_batch_timeout_seconds=_as_float(os.getenv("LLM_BATCH_TIMEOUT_SECONDS"), 86400.0),
+        llm_rows_per_prompt=max(1, _as_int(os.getenv("LLM_ROWS_PER_PROMPT"), 1)),
+        llm_rpm=_as_int(os.getenv("LLM_RPM"), 0),
+        llm_tpm=_as_int(os.getenv("LLM_TPM"), 0),
+        gemini_api_keys=(
+            _as_list(os.getenv("GEMINI_API_KEYS")) or _as_list(os.getenv("GEMINI_API_KEY"))
+        ),
+        gemini_model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash").strip(),
+        openai_api_keys=(
+            _as_list(os.getenv("OPENAI_API_KEYS")) or _as_list(os.getenv("OPENAI_API_KEY"))
+        ),
+        openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip(),
+    )
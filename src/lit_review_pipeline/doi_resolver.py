@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Collection
 from urllib.parse import quote
 
 import aiohttp
+import numpy as np
+import orjson
 import pandas as pd
 
+from .cache import CrossrefCache
 from .config import Settings
 
 LOGGER = logging.getLogger(__name__)
@@ -29,79 +32,177 @@ class DOIResolutionResult:
     attempts: int
 
 
+def doi_metadata_path(metadata_dir: Path, doi: str) -> Path:
+    """Return the sidecar file holding the Crossref metadata for `doi`."""
+    digest = hashlib.sha1(doi.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return metadata_dir / f"{digest}.json"
+
+
+def load_doi_metadata(doi: str, metadata_dir: Path) -> dict[str, Any] | None:
+    """Load persisted Crossref metadata for `doi`, or None if it was never resolved."""
+    path = doi_metadata_path(metadata_dir, doi.strip())
+    if not path.exists():
+        return None
+    return orjson.loads(path.read_bytes())
+
+
 class AsyncDOIResolver:
     """Resolve DOI metadata via Crossref using asynchronous HTTP calls."""
 
     BASE_URL = "https://api.crossref.org/works/"
+    PREWARM_URL = "https://api.crossref.org/"
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the connector binds to the running event loop and is
+        # reused by every `resolve_dataframe` call until `close()`.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.settings.doi_concurrency,
+                limit_per_host=self.settings.doi_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.settings.doi_timeout_seconds),
+                headers={
+                    "User-Agent": "automated-literature-review/0.1 (research-automation)",
+                },
+            )
+        return self._session
+
+    def _open_cache(self) -> CrossrefCache:
+        return CrossrefCache(
+            self.settings.crossref_cache_path,
+            ttl_seconds=self.settings.doi_cache_ttl_days * 86400,
+        )
+
+    async def prewarm(self) -> None:
+        """Open a pooled Crossref connection ahead of the first real lookup."""
+        try:
+            async with self._get_session().head(
+                self.PREWARM_URL,
+                timeout=aiohttp.ClientTimeout(total=5),
+            ):
+                pass
+        except Exception as exc:  # Best effort only; real calls retry on their own.
+            LOGGER.debug("Crossref prewarm failed: %s", exc)
+
+    async def close(self) -> None:
+        """Close the pooled Crossref session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def resolve_dataframe(
         self,
         df: pd.DataFrame,
         on_progress: Callable[[int, int], None] | None = None,
+        seed_dois: Collection[str] | None = None,
     ) -> pd.DataFrame:
-        """Resolve all unique DOIs in a DataFrame and append metadata columns."""
-        records = df.copy()
+        """
+        Resolve all unique DOIs in a DataFrame and append metadata columns.
+
+        Metadata is persisted once per DOI under `settings.doi_metadata_dir`
+        and rows only carry its `doi_metadata_path`. DOIs in `seed_dois`
+        (already resolved, with sidecars on disk) are never looked up. Columns
+        are set on a shallow copy, so `df` is left untouched.
+        """
+        records = df.copy(deep=False)
         records["doi"] = records.get("doi", "").fillna("").astype(str).str.strip()
+        self._reset_failures()
 
-        dois = sorted({doi for doi in records["doi"] if doi})
+        # One hash pass over the column: `uniques` drives the network fan-out and
+        # `codes` gathers per-DOI results back onto rows afterwards. Resolution
+        # order is irrelevant since results arrive via `as_completed`.
+        codes, uniques = pd.factorize(records["doi"].to_numpy())
+        dois = [doi for doi in uniques if doi]
         if not dois:
             records["doi_resolved"] = 0
             records["doi_resolution_error"] = None
-            records["doi_metadata"] = None
-            self._write_failures([])
+            records["doi_metadata_path"] = None
             return records
 
-        timeout = aiohttp.ClientTimeout(total=self.settings.doi_timeout_seconds)
         semaphore = asyncio.Semaphore(self.settings.doi_concurrency)
-
-        metadata_by_doi: dict[str, dict[str, Any]] = {}
+        resolved: set[str] = set()
+        if seed_dois:
+            resolved = {doi for doi in dois if doi in seed_dois}
+            LOGGER.info("Seeded DOIs: %s of %s", len(resolved), len(dois))
+        unseeded = [doi for doi in dois if doi not in resolved]
+        with self._open_cache() as cache:
+            cached = cache.get_many(unseeded)
+        for doi, metadata in cached.items():
+            self._write_metadata(doi, metadata, overwrite=False)
+        resolved.update(cached)
         errors_by_doi: dict[str, str] = {}
-        failures: list[dict[str, Any]] = []
-
-        processed = 0
-        async with aiohttp.ClientSession(
-            timeout=timeout,
-            headers={
-                "User-Agent": "automated-literature-review/0.1 (research-automation)",
-            },
-        ) as session:
-            tasks = [self._resolve_with_retry(session, semaphore, doi) for doi in dois]
-            for future in asyncio.as_completed(tasks):
-                result = await future
-                processed += 1
-                if on_progress is not None:
-                    on_progress(processed, len(dois))
-
-                if result.resolved and result.metadata is not None:
-                    metadata_by_doi[result.doi] = result.metadata
-                else:
-                    error_text = result.error or "Unknown error"
-                    errors_by_doi[result.doi] = error_text
-                    failures.append(
-                        {
-                            "doi": result.doi,
-                            "error": error_text,
-                            "status_code": result.status_code,
-                            "attempts": result.attempts,
-                            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                        }
-                    )
-
-        self._write_failures(failures)
+        fetched: dict[str, dict[str, Any]] = {}
+        pending = [doi for doi in unseeded if doi not in cached]
+        if cached:
+            LOGGER.info("Crossref cache hits: %s of %s DOIs", len(cached), len(unseeded))
+
+        processed = len(resolved)
+        if on_progress is not None and processed:
+            on_progress(processed, len(dois))
+
+        tasks = (
+            [self._resolve_with_retry(self._get_session(), semaphore, doi) for doi in pending]
+            if pending
+            else []
+        )
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            processed += 1
+            if on_progress is not None:
+                on_progress(processed, len(dois))
+
+            if result.resolved and result.metadata is not None:
+                resolved.add(result.doi)
+                fetched[result.doi] = result.metadata
+                self._write_metadata(result.doi, result.metadata, overwrite=True)
+            else:
+                error_text = result.error or "Unknown error"
+                errors_by_doi[result.doi] = error_text
+                self._append_failure(
+                    {
+                        "doi": result.doi,
+                        "error": error_text,
+                        "status_code": result.status_code,
+                        "attempts": result.attempts,
+                        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                    }
+                )
+
+        with self._open_cache() as cache:
+            cache.put_many(fetched)
+
         LOGGER.info(
             "DOI resolution finished: %s resolved, %s failed",
-            len(metadata_by_doi),
-            len(failures),
+            len(resolved),
+            len(errors_by_doi),
         )
 
-        records["doi_resolved"] = records["doi"].map(lambda d: int(bool(d and d in metadata_by_doi)))
-        records["doi_resolution_error"] = records["doi"].map(
-            lambda d: errors_by_doi.get(d) if d else None
+        # Build per-unique arrays once, then gather by factorized code. The empty
+        # DOI is never a dict key, so its rows fall through to 0/None.
+        metadata_dir = self.settings.doi_metadata_dir
+        resolved_arr = np.fromiter(
+            (doi in resolved for doi in uniques),
+            dtype=np.int8,
+            count=len(uniques),
         )
-        records["doi_metadata"] = records["doi"].map(lambda d: metadata_by_doi.get(d) if d else None)
+        err_arr = np.empty(len(uniques), dtype=object)
+        err_arr[:] = [errors_by_doi.get(doi) for doi in uniques]
+        path_arr = np.empty(len(uniques), dtype=object)
+        path_arr[:] = [
+            str(doi_metadata_path(metadata_dir, doi)) if doi in resolved else None for doi in uniques
+        ]
+
+        records["doi_resolved"] = resolved_arr[codes]
+        records["doi_resolution_error"] = err_arr[codes]
+        records["doi_metadata_path"] = path_arr[codes]
         return records
 
     async def _resolve_with_retry(
@@ -120,7 +221,7 @@ class AsyncDOIResolver:
                     async with session.get(url) as response:
                         status_code = response.status
                         if response.status == 200:
-                            payload = await response.json()
+                            payload = orjson.loads(await response.read())
                             metadata = payload.get("message", payload)
                             return DOIResolutionResult(
                                 doi=doi,
@@ -158,8 +259,19 @@ class AsyncDOIResolver:
             attempts=self.settings.doi_max_retries,
         )
 
-    def _write_failures(self, failures: list[dict[str, Any]]) -> None:
+    def _write_metadata(self, doi: str, metadata: dict[str, Any], *, overwrite: bool) -> None:
+        path = doi_metadata_path(self.settings.doi_metadata_dir, doi)
+        if overwrite or not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(orjson.dumps(metadata))
+
+    def _reset_failures(self) -> None:
         path: Path = self.settings.failed_doi_log_path
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(failures, handle, indent=2, ensure_ascii=True)
+        path.write_bytes(b"")
+
+    def _append_failure(self, failure: dict[str, Any]) -> None:
+        # NDJSON: one record per line, written as failures occur so the log is
+        # usable mid-run and each write costs O(1) rather than O(all failures).
+        with self.settings.failed_doi_log_path.open("ab") as handle:
+            handle.write(orjson.dumps(failure) + b"\n")
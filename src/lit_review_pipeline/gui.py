@@ -11,16 +11,20 @@ from tkinter import filedialog, messagebox, ttk
 from typing import Any
 
 from .pipeline import PipelineResult, run_pipeline
+from .writers import write_csv
+
+_PIPELINE_EVENT = "<<PipelineEvent>>"
 
 
 class PipelineGUI(tk.Tk):
     """Simple desktop UI for running pipeline jobs."""
 
+    # Share of the progress bar (in percent) each stage fills when complete.
     _STAGE_WEIGHTS = {
-        "ingestion": (0, 5),
-        "preprocess": (5, 5),
-        "doi": (10, 30),
-        "llm": (40, 60),
+        "ingestion": 5,
+        "preprocess": 5,
+        "doi": 30,
+        "llm": 60,
     }
 
     def __init__(self) -> None:
@@ -36,11 +40,12 @@ class PipelineGUI(tk.Tk):
         self.status_var = tk.StringVar(value="Idle")
         self.progress_var = tk.DoubleVar(value=0.0)
 
-        self._events: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self._events: queue.SimpleQueue[tuple[str, Any]] = queue.SimpleQueue()
+        self._stage_fractions: dict[str, float] = {}
         self._worker: threading.Thread | None = None
 
         self._build_layout()
-        self.after(150, self._poll_events)
+        self.bind(_PIPELINE_EVENT, self._poll_events)
 
     def _build_layout(self) -> None:
         frame = ttk.Frame(self, padding=16)
@@ -120,6 +125,7 @@ class PipelineGUI(tk.Tk):
 
         self.run_button.configure(state="disabled")
         self.progress_var.set(0.0)
+        self._stage_fractions.clear()
         self.status_var.set("Starting pipeline...")
 
         self._worker = threading.Thread(
@@ -135,7 +141,7 @@ class PipelineGUI(tk.Tk):
 
     def _run_pipeline_worker(self, input_path: str, output_dir: str, llm_provider: str) -> None:
         def callback(stage: str, completed: int, total: int) -> None:
-            self._events.put(("progress", {"stage": stage, "completed": completed, "total": total}))
+            self._post_event("progress", {"stage": stage, "completed": completed, "total": total})
 
         try:
             result = run_pipeline(
@@ -144,27 +150,42 @@ class PipelineGUI(tk.Tk):
                 llm_provider=llm_provider,
                 progress_callback=callback,
             )
-            self._events.put(("done", result))
+            self._post_event("done", result)
         except Exception as exc:
-            self._events.put(("error", str(exc)))
+            self._post_event("error", str(exc))
 
-    def _poll_events(self) -> None:
-        while not self._events.empty():
-            event_type, payload = self._events.get()
+    def _post_event(self, event_type: str, payload: Any) -> None:
+        """Queue an event from the worker thread and wake the Tk loop to drain it."""
+        self._events.put((event_type, payload))
+        try:
+            self.event_generate(_PIPELINE_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # Window already closed.
+
+    def _poll_events(self, _event: tk.Event | None = None) -> None:
+        while True:
+            try:
+                event_type, payload = self._events.get_nowait()
+            except queue.Empty:
+                return
             if event_type == "progress":
                 self._handle_progress(payload)
             elif event_type == "done":
                 self._handle_done(payload)
             elif event_type == "error":
                 self._handle_error(payload)
-        self.after(150, self._poll_events)
 
     def _handle_progress(self, payload: dict[str, Any]) -> None:
         stage = str(payload["stage"])
         completed = int(payload["completed"])
         total = max(int(payload["total"]), 1)
-        base, span = self._STAGE_WEIGHTS.get(stage, (0, 0))
-        percent = base + (completed / total) * span
+        # DOI and LLM stages report concurrently, so sum per-stage progress
+        # instead of deriving the bar position from the latest event alone.
+        self._stage_fractions[stage] = completed / total
+        percent = sum(
+            span * self._stage_fractions.get(name, 0.0)
+            for name, span in self._STAGE_WEIGHTS.items()
+        )
         self.progress_var.set(min(100.0, max(0.0, percent)))
         self.status_var.set(f"{stage.upper()} {completed}/{total}")
 
@@ -173,7 +194,10 @@ class PipelineGUI(tk.Tk):
         if selected_csv:
             target_csv = Path(selected_csv)
             target_csv.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(result.output_csv, target_csv)
+            if result.output_csv is not None:
+                shutil.copyfile(result.output_csv, target_csv)
+            else:
+                write_csv(result.final_dataframe, target_csv)
 
         self.progress_var.set(100.0)
         self.status_var.set("Completed successfully.")
@@ -182,8 +206,8 @@ class PipelineGUI(tk.Tk):
             "Pipeline complete",
             (
                 f"Run ID: {result.run_id}\n"
-                f"CSV: {result.output_csv}\n"
                 f"Parquet: {result.output_parquet}"
+                + (f"\nCSV: {result.output_csv}" if result.output_csv is not None else "")
                 + (f"\nSaved CSV: {selected_csv}" if selected_csv else "")
             ),
         )
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+import ijson
+import numpy as np
 import pandas as pd
 
 from .constants import REQUIRED_COLUMNS
 
 LOGGER = logging.getLogger(__name__)
 
+JSON_CHUNK_SIZE = 50_000
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://doi\.org/)?(?:doi:\s*)?", re.IGNORECASE)
+
 
 def _inverted_index_to_text(inverted_index: dict[str, list[int]]) -> str:
     """
@@ -24,54 +30,111 @@ def _inverted_index_to_text(inverted_index: dict[str, list[int]]) -> str:
     if not inverted_index:
         return ""
 
-    positions: dict[int, str] = {}
-    for token, indexes in inverted_index.items():
-        for idx in indexes:
-            positions[idx] = token
-    return " ".join(token for _, token in sorted(positions.items(), key=lambda x: x[0]))
+    # Flatten to parallel (token, position) arrays and let one C-level argsort
+    # order the abstract instead of hashing and sorting per-token tuples.
+    counts = [len(indexes) for indexes in inverted_index.values()]
+    tokens = np.repeat(np.array(list(inverted_index), dtype=object), counts)
+    positions = np.fromiter(
+        chain.from_iterable(inverted_index.values()),
+        dtype=np.int64,
+        count=len(tokens),
+    )
+    return " ".join(tokens[np.argsort(positions, kind="stable")].tolist())
 
 
 def _normalize_openalex_schema(frame: pd.DataFrame) -> pd.DataFrame:
-    """Normalize source columns to expected pipeline schema."""
-    df = frame.copy()
+    """
+    Normalize source columns to expected pipeline schema.
+
+    Columns are assigned on `frame` directly; the loader owns the frame, so no
+    defensive copy is taken.
+    """
+    df = frame
 
     if "abstract" not in df.columns and "abstract_inverted_index" in df.columns:
-        df["abstract"] = df["abstract_inverted_index"].apply(
-            lambda x: _inverted_index_to_text(x) if isinstance(x, dict) else ""
-        )
+        indexes = df["abstract_inverted_index"].to_numpy()
+        is_dict = np.fromiter((isinstance(x, dict) for x in indexes), dtype=bool, count=len(indexes))
+        abstracts = np.full(len(indexes), "", dtype=object)
+        if is_dict.any():
+            abstracts[is_dict] = np.vectorize(_inverted_index_to_text, otypes=[object])(indexes[is_dict])
+        df["abstract"] = abstracts
 
     for column in REQUIRED_COLUMNS:
         if column not in df.columns:
             df[column] = None
 
-    # Normalize DOI string format.
-    df["doi"] = (
-        df["doi"]
-        .fillna("")
-        .astype(str)
-        .str.strip()
-        .str.replace(r"^https?://doi\.org/", "", regex=True, case=False)
-        .str.replace(r"^doi:\s*", "", regex=True, case=False)
-        .str.strip()
-    )
-    df.loc[df["doi"] == "", "doi"] = None
+    # Normalize DOI string format. Downstream code relies on every DOI being a
+    # stripped, prefix-free, non-empty string or None.
+    doi = df["doi"].fillna("").astype(str).str.strip()
+    doi = doi.str.replace(_DOI_PREFIX_RE, "", regex=True).str.strip()
+    df["doi"] = doi.mask(doi == "", None)
 
     return df
 
 
-def _load_json(path: Path) -> pd.DataFrame:
-    with path.open("r", encoding="utf-8") as handle:
-        payload: Any = json.load(handle)
+def _json_records_to_frame(records: list[Any]) -> pd.DataFrame:
+    """
+    Flatten JSON records, keeping `abstract_inverted_index` as one dict column.
 
-    if isinstance(payload, dict):
-        if "results" in payload and isinstance(payload["results"], list):
-            return pd.json_normalize(payload["results"])
-        return pd.json_normalize(payload)
+    `json_normalize` would otherwise explode every abstract term into its own
+    column and the index could no longer be turned back into text. The index
+    is popped from the (freshly parsed, caller-owned) records and gathered
+    into its own column list instead of rebuilding every record dict.
+    """
+    inverted = [
+        record.pop("abstract_inverted_index", None) if isinstance(record, dict) else None
+        for record in records
+    ]
+    frame = pd.json_normalize(records)
+    if any(index is not None for index in inverted):
+        frame["abstract_inverted_index"] = inverted
+    return frame
 
-    if isinstance(payload, list):
-        return pd.json_normalize(payload)
 
-    raise ValueError(f"Unsupported JSON structure in {path}.")
+def _first_json_byte(path: Path) -> bytes:
+    with path.open("rb") as handle:
+        while chunk := handle.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1]
+    return b""
+
+
+def _frames_from_records(records: Iterator[Any]) -> list[pd.DataFrame]:
+    """Normalize streamed records in fixed-size chunks to bound peak memory."""
+    frames: list[pd.DataFrame] = []
+    while chunk := list(islice(records, JSON_CHUNK_SIZE)):
+        frames.append(_json_records_to_frame(chunk))
+    return frames
+
+
+def _load_json(path: Path) -> pd.DataFrame:
+    """
+    Stream records with `ijson` so the export never materializes as one object.
+
+    Accepts a top-level list of records, an object with a `results` list (the
+    OpenAlex API shape) or a single record object.
+    """
+    first = _first_json_byte(path)
+    if first not in (b"[", b"{"):
+        raise ValueError(f"Unsupported JSON structure in {path}.")
+
+    prefix = "item" if first == b"[" else "results.item"
+    with path.open("rb") as handle:
+        frames = _frames_from_records(ijson.items(handle, prefix, use_float=True))
+
+    if not frames and first == b"{":
+        # No `results` items: either an empty result set or a single record.
+        with path.open("rb") as handle:
+            payload: Any = next(ijson.items(handle, "", use_float=True))
+        if not isinstance(payload.get("results"), list):
+            frames = [_json_records_to_frame([payload])]
+
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
 
 
 def load_openalex_data(input_path: str | Path) -> pd.DataFrame:
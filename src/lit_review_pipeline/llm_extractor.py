@@ -2,38 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterator
 
+import numpy as np
+import orjson
 import pandas as pd
 
-from .clients import BaseLLMClient, GeminiClient, OpenAIClient
+from .async_utils import run_async
+from .cache import LLMResponseCache, LLMResponseStore
+from .clients import BaseLLMClient, CachedLLMClient, GeminiClient, OpenAIClient
 from .config import Settings
 from .constants import STRUCTURED_FIELDS
 
 LOGGER = logging.getLogger(__name__)
 _CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+_PROMPT_FIELDS = ("title", "publication_year", "type", "abstract")
+_PROMPT_TOKEN_RE = re.compile(r"\{(title|publication_year|publication_type|abstract)\}")
+
+
+def _prompt_field_column(df: pd.DataFrame, column: str) -> list[str]:
+    """Column counterpart of `str(row.get(column, "") or "")`, treating `pd.NA` as missing."""
+    if column not in df.columns:
+        return [""] * len(df)
+    return [
+        "" if value is None or value is pd.NA else str(value or "")
+        for value in df[column].to_numpy(dtype=object)
+    ]
+
+
+def _prompt_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Per-row extractor inputs: the source `id` plus the prompt fields as strings.
+
+    Only these columns are read, zipped from their arrays, so the rest of the
+    frame is never boxed into row dicts the way `to_dict(orient="records")` does.
+    """
+    ids = df["id"].to_numpy(dtype=object) if "id" in df.columns else [None] * len(df)
+    keys = ("id", *_PROMPT_FIELDS)
+    columns = [_prompt_field_column(df, column) for column in _PROMPT_FIELDS]
+    return [dict(zip(keys, values)) for values in zip(ids, *columns)]
+
+
+def _prompt_values(row: dict[str, Any]) -> dict[str, str]:
+    """Template placeholder values for one row (`type` is exposed as `publication_type`)."""
+    return {
+        "title": str(row.get("title", "") or ""),
+        "publication_year": str(row.get("publication_year", "") or ""),
+        "publication_type": str(row.get("type", "") or ""),
+        "abstract": str(row.get("abstract", "") or ""),
+    }
 
 
 def create_llm_client(settings: Settings) -> BaseLLMClient:
     """Instantiate configured provider client."""
     provider = settings.llm_provider.strip().lower()
+    client: BaseLLMClient
     if provider == "gemini":
-        return GeminiClient(settings)
-    if provider == "openai":
-        return OpenAIClient(settings)
-    raise ValueError(f"Unsupported llm provider: {settings.llm_provider}")
-
-
-def _default_value(field_name: str) -> Any:
-    list_fields = {
+        client = GeminiClient(settings)
+    elif provider == "openai":
+        client = OpenAIClient(settings)
+    else:
+        raise ValueError(f"Unsupported llm provider: {settings.llm_provider}")
+
+    if settings.llm_cache_enabled:
+        client = CachedLLMClient(
+            client,
+            LLMResponseCache(settings.llm_cache_path),
+            temperature=settings.llm_temperature,
+            refresh=settings.overwrite_existing_responses,
+        )
+    return client
+
+
+_LIST_FIELDS = frozenset(
+    {
         "use_cases",
         "opportunities",
         "challenges",
@@ -43,72 +94,113 @@ def _default_value(field_name: str) -> Any:
         "kpis",
         "stakeholders",
     }
-    if field_name in list_fields:
+)
+
+
+def _default_value(field_name: str) -> Any:
+    if field_name in _LIST_FIELDS:
         return []
-    if field_name == "confidence_score":
-        return None
     return None
 
 
-def _safe_record_id(value: str) -> str:
-    if not value:
-        return ""
-    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_")
+def _as_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+    return str(value)
 
 
-def _row_record_id_base(row: dict[str, Any], row_index: int) -> str:
-    existing_record_id = str(row.get("record_id", "") or "").strip()
-    if existing_record_id:
-        safe_existing = _safe_record_id(existing_record_id)
-        if safe_existing:
-            return safe_existing
+def _coerce_field(field_name: str, value: Any) -> Any:
+    """
+    Force one field to its schema type: list of strings, float score, or string.
 
-    source_id = str(row.get("id", "") or "").strip()
-    if source_id:
-        safe = _safe_record_id(source_id)
-        if safe:
-            return safe
+    Models occasionally answer `"high"` for the score or a bare number for a
+    text field; without this a column would hold mixed scalar types, which
+    Parquet cannot store. Unparseable scores become None.
+    """
+    if value is None:
+        return _default_value(field_name)
+    if field_name in _LIST_FIELDS:
+        items = value if isinstance(value, list) else [value]
+        return [_as_text(item) for item in items if item is not None]
+    if field_name == "confidence_score":
+        if isinstance(value, bool):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return _as_text(value)
 
-    fingerprint = "|".join(
-        [
-            str(row.get("title", "") or ""),
-            str(row.get("publication_year", "") or ""),
-            str(row.get("type", "") or ""),
-            str(row_index),
-        ]
-    )
-    short_hash = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
-    return f"record_{short_hash}"
+
+_UNSAFE_RECORD_ID_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+_FINGERPRINT_COLUMNS = ("title", "publication_year", "type")
+
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[column].astype(object).fillna("").astype(str).str.strip()
+
+
+def _safe_record_id_series(values: pd.Series) -> pd.Series:
+    return values.str.replace(_UNSAFE_RECORD_ID_RE, "_", regex=True).str.strip("_")
 
 
-def _generate_unique_record_ids(rows: list[dict[str, Any]]) -> list[str]:
+def _record_id_bases(df: pd.DataFrame) -> list[str]:
+    """
+    Column-wise record-id bases: sanitized `record_id`, else sanitized `id`,
+    else `record_<hash>` of title, year, type and row position.
+    """
+    bases = _safe_record_id_series(_text_column(df, "record_id"))
+    bases = bases.where(bases != "", _safe_record_id_series(_text_column(df, "id")))
+
+    ids = bases.to_numpy(dtype=object)
+    missing = ids == ""
+    if missing.any():
+        # `hash_pandas_object` hashes whole columns in C with a fixed key, so the
+        # fallback stays deterministic across runs without a per-row sha1.
+        fingerprint = pd.DataFrame(
+            {column: _text_column(df, column).to_numpy()[missing] for column in _FINGERPRINT_COLUMNS}
+        )
+        fingerprint["row_index"] = np.flatnonzero(missing)
+        hashes = pd.util.hash_pandas_object(fingerprint, index=False).to_numpy()
+        ids[missing] = [f"record_{value:016x}" for value in hashes.tolist()]
+    return ids.tolist()
+
+
+def _generate_unique_record_ids(df: pd.DataFrame) -> list[str]:
     """
     Build deterministic, unique record IDs.
 
     If a base ID appears multiple times, every occurrence gets an ordinal suffix:
     `<base>__1`, `<base>__2`, ...
     """
-    base_ids = [_row_record_id_base(row=row, row_index=idx) for idx, row in enumerate(rows)]
-    total_counts: dict[str, int] = {}
-    for base in base_ids:
-        total_counts[base] = total_counts.get(base, 0) + 1
+    base_ids = _record_id_bases(df)
+    totals = Counter(base_ids)
+    if len(totals) == len(base_ids):
+        return base_ids
 
-    seen: dict[str, int] = {}
+    seen: defaultdict[str, int] = defaultdict(int)
     unique_ids: list[str] = []
     for base in base_ids:
-        seen[base] = seen.get(base, 0) + 1
-        if total_counts[base] == 1:
+        if totals[base] == 1:
             unique_ids.append(base)
         else:
+            seen[base] += 1
             unique_ids.append(f"{base}__{seen[base]}")
     return unique_ids
 
 
 def attach_record_ids(df: pd.DataFrame) -> pd.DataFrame:
-    """Attach deterministic `record_id` column used for persistence/recovery."""
-    records = df.copy()
-    row_dicts = records.to_dict(orient="records")
-    records["record_id"] = _generate_unique_record_ids(row_dicts)
+    """
+    Attach deterministic `record_id` column used for persistence/recovery.
+
+    Returns a shallow copy; `df` itself is left untouched.
+    """
+    records = df.copy(deep=False)
+    records["record_id"] = _generate_unique_record_ids(records)
     return records
 
 
@@ -119,13 +211,25 @@ def _clean_json_text(raw_text: str) -> str:
     return text
 
 
+def _parse_marshaled_response(raw_text: str) -> dict[str, dict[str, Any]]:
+    """Map `record_id -> fields` from a multi-row reply (a JSON array, or an object wrapping one)."""
+    parsed = orjson.loads(_clean_json_text(raw_text))
+    if isinstance(parsed, dict):
+        parsed = next((value for value in parsed.values() if isinstance(value, list)), None)
+    if not isinstance(parsed, list):
+        raise ValueError("Multi-row LLM output JSON was not an array.")
+    items: dict[str, dict[str, Any]] = {}
+    for item in parsed:
+        if isinstance(item, dict) and item.get("record_id") is not None:
+            fields = {key: value for key, value in item.items() if key != "record_id"}
+            items[str(item["record_id"])] = fields
+    return items
+
+
 def _normalize_structured_payload(payload: dict[str, Any]) -> dict[str, Any]:
     normalized: dict[str, Any] = {}
     for field in STRUCTURED_FIELDS:
-        value = payload.get(field, _default_value(field))
-        if isinstance(value, str):
-            value = value.strip()
-        normalized[field] = value
+        normalized[field] = _coerce_field(field, payload.get(field))
     return normalized
 
 
@@ -137,22 +241,82 @@ class ExtractionResult:
     skipped_existing: bool
 
 
+def _group_by_key(keys: list[str]) -> dict[str, list[int]]:
+    """Group row positions by response key, preserving first-seen order."""
+    groups: dict[str, list[int]] = {}
+    for idx, key in enumerate(keys):
+        groups.setdefault(key, []).append(idx)
+    return groups
+
+
+def _fan_out(
+    result: ExtractionResult,
+    indexes: list[int],
+    record_ids: list[str],
+) -> Iterator[tuple[int, ExtractionResult]]:
+    """Yield one result per duplicate row, relabelled with that row's record id."""
+    yield indexes[0], result
+    for idx in indexes[1:]:
+        yield idx, replace(result, record_id=record_ids[idx])
+
+
 class AbstractStructuringExtractor:
-    """Threaded LLM extraction with persistence and skip-on-existing semantics."""
+    """Concurrent async LLM extraction with persistence and skip-on-existing semantics."""
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.client = create_llm_client(settings)
         self.prompt_template = Path(settings.prompt_template_path).read_text(encoding="utf-8")
+        self.batch_prompt_template = (
+            Path(settings.batch_prompt_template_path).read_text(encoding="utf-8")
+            if settings.llm_rows_per_prompt > 1
+            else None
+        )
+        # Multi-row runs store responses produced by either template, so both
+        # feed the fingerprint; single-row keys are unchanged.
+        template_hasher = hashlib.sha256(self.prompt_template.encode("utf-8"), usedforsecurity=False)
+        if self.batch_prompt_template is not None:
+            template_hasher.update(b"\x00" + self.batch_prompt_template.encode("utf-8"))
+        self._template_sha = template_hasher.hexdigest()[:16]
+        self._store: LLMResponseStore | None = None
 
     def extract_dataframe(
         self,
         df: pd.DataFrame,
         on_progress: Callable[[int, int], None] | None = None,
     ) -> pd.DataFrame:
-        records = df.copy()
-        row_dicts = records.to_dict(orient="records")
-        record_ids = _generate_unique_record_ids(row_dicts)
+        """Synchronous wrapper around `aextract_dataframe`."""
+
+        async def _run() -> pd.DataFrame:
+            try:
+                return await self.aextract_dataframe(df, on_progress=on_progress)
+            finally:
+                await self.client.aclose()
+
+        return run_async(_run())
+
+    async def aextract_dataframe(
+        self,
+        df: pd.DataFrame,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> pd.DataFrame:
+        self._store = LLMResponseStore(self.settings.llm_response_store_path)
+        try:
+            return await self._aextract_records(df, on_progress)
+        finally:
+            self._store.close()
+            self._store = None
+
+    async def _aextract_records(
+        self,
+        df: pd.DataFrame,
+        on_progress: Callable[[int, int], None] | None,
+    ) -> pd.DataFrame:
+        # Only whole columns are added below, so a shallow copy keeps `df` intact.
+        records = df.copy(deep=False)
+        row_dicts = _prompt_rows(records)
+        record_ids = _generate_unique_record_ids(records)
+        response_keys = self._response_keys(records)
 
         if records.empty:
             records["record_id"] = []
@@ -165,124 +329,316 @@ class AbstractStructuringExtractor:
             return records
 
         failures: list[dict[str, Any]] = []
-        extraction_rows: list[dict[str, Any]] = []
-
-        with ThreadPoolExecutor(max_workers=self.settings.llm_max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self._extract_one,
-                    row=row,
-                    row_index=idx,
-                    record_id=record_ids[idx],
-                ): idx
-                for idx, row in enumerate(row_dicts)
-            }
+        # Results arrive out of order; slotting them by row position lets the
+        # columns be assigned directly instead of joined back onto `records`.
+        payloads: list[dict[str, Any] | None] = [None] * len(row_dicts)
+        errors: list[str | None] = [None] * len(row_dicts)
+
+        if self.settings.llm_batch_mode and self.client.supports_batch:
+            outcomes = self._iter_batched(row_dicts, record_ids, response_keys)
+        elif self.settings.llm_rows_per_prompt > 1:
+            outcomes = self._iter_marshaled(row_dicts, record_ids, response_keys)
+        else:
+            outcomes = self._iter_concurrent(row_dicts, record_ids, response_keys)
+
+        completed = 0
+        total = len(row_dicts)
+        async for idx, result in outcomes:
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, total)
+
+            if result.error:
+                failures.append(
+                    {
+                        "record_id": record_ids[idx],
+                        "source_id": row_dicts[idx].get("id"),
+                        "error": result.error,
+                        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                    }
+                )
+                errors[idx] = result.error
+            else:
+                payloads[idx] = result.structured
 
-            completed = 0
-            total = len(futures)
-            for future in as_completed(futures):
-                idx = futures[future]
-                row = row_dicts[idx]
-                record_id = record_ids[idx]
-                completed += 1
-                if on_progress is not None:
-                    on_progress(completed, total)
+        self._write_failed_llm_log(failures)
+        self._require_store().index_records(
+            {
+                record_id: key
+                for record_id, key, payload in zip(record_ids, response_keys, payloads)
+                if payload is not None
+            }
+        )
 
+        blank = self._blank_payload()
+        records["record_id"] = record_ids
+        for field in STRUCTURED_FIELDS:
+            records[field] = [
+                payload[field] if payload is not None else blank[field] for payload in payloads
+            ]
+        records["llm_extraction_error"] = errors
+        records["llm_provider"] = self.client.provider
+        records["llm_model"] = self.client.model
+        return records
+
+    async def _iter_concurrent(
+        self,
+        row_dicts: list[dict[str, Any]],
+        record_ids: list[str],
+        response_keys: list[str],
+    ) -> AsyncIterator[tuple[int, ExtractionResult]]:
+        """
+        Yield per-row results as concurrent single-prompt calls complete.
+
+        Rows sharing a response key are sent once; every duplicate row receives
+        the same result.
+        """
+        semaphore = asyncio.Semaphore(self.settings.llm_max_workers)
+        groups = _group_by_key(response_keys)
+
+        async def _indexed(idx: int) -> tuple[int, ExtractionResult]:
+            async with semaphore:
                 try:
-                    result = future.result()
-                except Exception as exc:  # pragma: no cover - defensive guard.
-                    LOGGER.exception("Unhandled extraction error for %s", record_id)
-                    failures.append(
-                        {
-                            "record_id": record_id,
-                            "source_id": row.get("id"),
-                            "error": f"Unhandled exception: {exc}",
-                            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                        }
-                    )
-                    extraction_rows.append(
-                        {
-                            "_row_index": idx,
-                            "record_id": record_id,
-                            **self._blank_payload(),
-                            "llm_extraction_error": f"Unhandled exception: {exc}",
-                        }
-                    )
-                    continue
-
-                if result.error:
-                    failures.append(
-                        {
-                            "record_id": record_id,
-                            "source_id": row.get("id"),
-                            "error": result.error,
-                            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                        }
+                    result = await self._extract_one(
+                        row=row_dicts[idx],
+                        record_id=record_ids[idx],
+                        response_key=response_keys[idx],
                     )
-                    extraction_rows.append(
-                        {
-                            "_row_index": idx,
-                            "record_id": record_id,
-                            **self._blank_payload(),
-                            "llm_extraction_error": result.error,
-                        }
-                    )
-                else:
-                    extraction_rows.append(
-                        {
-                            "_row_index": idx,
-                            "record_id": record_id,
-                            **(result.structured or self._blank_payload()),
-                            "llm_extraction_error": None,
-                        }
+                except Exception as exc:  # pragma: no cover - defensive guard.
+                    LOGGER.exception("Unhandled extraction error for %s", record_ids[idx])
+                    result = ExtractionResult(
+                        record_id=record_ids[idx],
+                        structured=None,
+                        error=f"Unhandled exception: {exc}",
+                        skipped_existing=False,
                     )
+            return idx, result
 
-        self._write_failed_llm_log(failures)
-        extraction_df = pd.DataFrame(extraction_rows)
-        if extraction_df.empty:
-            extraction_df = pd.DataFrame(
-                columns=["_row_index", "record_id", *STRUCTURED_FIELDS, "llm_extraction_error"]
-            )
+        tasks = [asyncio.ensure_future(_indexed(indexes[0])) for indexes in groups.values()]
+        for future in asyncio.as_completed(tasks):
+            first, result = await future
+            for item in _fan_out(result, groups[response_keys[first]], record_ids):
+                yield item
 
-        records["record_id"] = record_ids
-        records["_row_index"] = list(range(len(records)))
-        merged = records.merge(extraction_df, on=["_row_index", "record_id"], how="left", sort=False)
-        merged = merged.drop(columns=["_row_index"])
-        merged["llm_provider"] = self.client.provider
-        merged["llm_model"] = self.client.model
-        return merged
-
-    def _extract_one(
+    async def _iter_marshaled(
+        self,
+        row_dicts: list[dict[str, Any]],
+        record_ids: list[str],
+        response_keys: list[str],
+    ) -> AsyncIterator[tuple[int, ExtractionResult]]:
+        """
+        Yield per-row results, packing up to `llm_rows_per_prompt` rows into each call.
+
+        One call per group of rows keeps throughput up under per-minute request
+        quotas. Rows missing or malformed in a multi-row reply are retried
+        through the single-row path.
+        """
+        groups = _group_by_key(response_keys)
+        pending: list[int] = []
+        for indexes in groups.values():
+            first = indexes[0]
+            existing = self._load_existing(record_ids[first], response_keys[first])
+            if existing is None:
+                pending.append(first)
+                continue
+            for item in _fan_out(existing, indexes, record_ids):
+                yield item
+
+        size = self.settings.llm_rows_per_prompt
+        semaphore = asyncio.Semaphore(self.settings.llm_max_workers)
+
+        async def _chunk(chunk: list[int]) -> list[tuple[int, ExtractionResult]]:
+            async with semaphore:
+                return await self._extract_chunk(chunk, row_dicts, record_ids, response_keys)
+
+        tasks = [
+            asyncio.ensure_future(_chunk(pending[start : start + size]))
+            for start in range(0, len(pending), size)
+        ]
+        for future in asyncio.as_completed(tasks):
+            for first, result in await future:
+                for item in _fan_out(result, groups[response_keys[first]], record_ids):
+                    yield item
+
+    async def _iter_batched(
+        self,
+        row_dicts: list[dict[str, Any]],
+        record_ids: list[str],
+        response_keys: list[str],
+    ) -> AsyncIterator[tuple[int, ExtractionResult]]:
+        """Yield per-row results using one provider batch job for all uncached rows."""
+        groups = _group_by_key(response_keys)
+        pending: list[int] = []
+        for indexes in groups.values():
+            first = indexes[0]
+            existing = self._load_existing(record_ids[first], response_keys[first])
+            if existing is None:
+                pending.append(first)
+                continue
+            for item in _fan_out(existing, indexes, record_ids):
+                yield item
+
+        if not pending:
+            return
+
+        prompts = [self._build_prompt(row_dicts[idx]) for idx in pending]
+        LOGGER.info("Submitting %s prompts as one %s batch job", len(prompts), self.client.provider)
+        try:
+            # Upload and polling are blocking; keep them off the event loop.
+            responses = await asyncio.to_thread(self.client.generate_batch, prompts)
+        except Exception as exc:
+            responses = [exc] * len(pending)
+
+        for first, response in zip(pending, responses):
+            if isinstance(response, Exception):
+                result = ExtractionResult(
+                    record_id=record_ids[first],
+                    structured=None,
+                    error=str(response),
+                    skipped_existing=False,
+                )
+            else:
+                result = self._structure_response(
+                    row_dicts[first],
+                    record_ids[first],
+                    response_keys[first],
+                    response,
+                )
+            for item in _fan_out(result, groups[response_keys[first]], record_ids):
+                yield item
+
+    def _build_batch_prompt(self, rows: list[tuple[str, dict[str, Any]]]) -> str:
+        records = [{"record_id": record_id, **_prompt_values(row)} for record_id, row in rows]
+        template = self.batch_prompt_template or ""
+        return template.replace("{records}", orjson.dumps(records, option=orjson.OPT_INDENT_2).decode())
+
+    def _response_keys(self, records: pd.DataFrame) -> list[str]:
+        """
+        Content address of each row's LLM response.
+
+        Covers provider, model, prompt templates and every prompt field, so
+        identical inputs share one stored response and template or model
+        changes miss the store instead of reusing stale output. The shared
+        prefix is hashed once and each row only feeds its own fields into a
+        copy of that state, read column-wise rather than from row dicts.
+        """
+        prefix = hashlib.sha256(
+            "\x00".join([self.client.provider, self.client.model, self._template_sha, ""]).encode(
+                "utf-8", "ignore"
+            ),
+            usedforsecurity=False,
+        )
+        keys: list[str] = []
+        for values in zip(*(_prompt_field_column(records, column) for column in _PROMPT_FIELDS)):
+            hasher = prefix.copy()
+            hasher.update("\x00".join(values).encode("utf-8", "ignore"))
+            keys.append(hasher.hexdigest())
+        return keys
+
+    def _require_store(self) -> LLMResponseStore:
+        if self._store is None:
+            raise RuntimeError("Response store is only open inside `aextract_dataframe`.")
+        return self._store
+
+    def _load_existing(self, record_id: str, response_key: str) -> ExtractionResult | None:
+        if self.settings.overwrite_existing_responses:
+            return None
+        stored = self._require_store().get(response_key)
+        if not isinstance(stored, dict):
+            return None
+        cached = _normalize_structured_payload(stored)
+        return ExtractionResult(
+            record_id=record_id,
+            structured=cached,
+            error=None,
+            skipped_existing=True,
+        )
+
+    async def _extract_one(
         self,
         row: dict[str, Any],
-        row_index: int,
         record_id: str,
+        response_key: str,
     ) -> ExtractionResult:
-        response_path = self.settings.llm_responses_dir / f"{record_id}.json"
-
-        if response_path.exists() and not self.settings.overwrite_existing_responses:
-            cached = self._load_response_file(response_path)
-            if cached is not None:
-                return ExtractionResult(
-                    record_id=record_id,
-                    structured=cached,
-                    error=None,
-                    skipped_existing=True,
-                )
+        existing = self._load_existing(record_id, response_key)
+        if existing is not None:
+            return existing
 
         prompt = self._build_prompt(row)
         try:
-            raw_response = self.client.generate(prompt)
+            raw_response = await self.client.agenerate(prompt)
+        except Exception as exc:
+            return ExtractionResult(
+                record_id=record_id,
+                structured=None,
+                error=str(exc),
+                skipped_existing=False,
+            )
+        return self._structure_response(row, record_id, response_key, raw_response)
+
+    async def _extract_chunk(
+        self,
+        chunk: list[int],
+        row_dicts: list[dict[str, Any]],
+        record_ids: list[str],
+        response_keys: list[str],
+    ) -> list[tuple[int, ExtractionResult]]:
+        items: dict[str, dict[str, Any]] = {}
+        try:
+            raw_response = await self.client.agenerate(
+                self._build_batch_prompt([(record_ids[idx], row_dicts[idx]) for idx in chunk])
+            )
+            items = _parse_marshaled_response(raw_response)
+        except Exception as exc:
+            LOGGER.warning("Multi-row prompt failed (%s); retrying %s rows individually", exc, len(chunk))
+
+        results: list[tuple[int, ExtractionResult]] = []
+        retry: list[int] = []
+        for idx in chunk:
+            item = items.get(record_ids[idx])
+            result = (
+                self._structure_response(
+                    row_dicts[idx],
+                    record_ids[idx],
+                    response_keys[idx],
+                    orjson.dumps(item).decode(),
+                )
+                if item is not None
+                else None
+            )
+            if result is None or result.error:
+                retry.append(idx)
+            else:
+                results.append((idx, result))
+
+        if retry:
+            singles = await asyncio.gather(
+                *(self._extract_one(row_dicts[idx], record_ids[idx], response_keys[idx]) for idx in retry)
+            )
+            results.extend(zip(retry, singles))
+        return results
+
+    def _structure_response(
+        self,
+        row: dict[str, Any],
+        record_id: str,
+        response_key: str,
+        raw_response: str,
+    ) -> ExtractionResult:
+        """Parse a raw LLM response, normalize it and persist it for recovery."""
+        try:
             cleaned = _clean_json_text(raw_response)
-            parsed = json.loads(cleaned)
+            parsed = orjson.loads(cleaned)
             if not isinstance(parsed, dict):
                 raise ValueError("LLM output JSON was not an object.")
             structured = _normalize_structured_payload(parsed)
-            self._write_response_file(
-                path=response_path,
-                row=row,
+            self._require_store().put(
+                response_key,
+                structured,
                 record_id=record_id,
-                structured=structured,
+                source_id=row.get("id"),
+                provider=self.client.provider,
+                model=self.client.model,
                 raw_response=raw_response,
             )
             return ExtractionResult(
@@ -300,48 +656,10 @@ class AbstractStructuringExtractor:
             )
 
     def _build_prompt(self, row: dict[str, Any]) -> str:
-        prompt = self.prompt_template
-        replacements = {
-            "{title}": str(row.get("title", "") or ""),
-            "{publication_year}": str(row.get("publication_year", "") or ""),
-            "{publication_type}": str(row.get("type", "") or ""),
-            "{abstract}": str(row.get("abstract", "") or ""),
-        }
-        for token, value in replacements.items():
-            prompt = prompt.replace(token, value)
-        return prompt
-
-    def _write_response_file(
-        self,
-        path: Path,
-        row: dict[str, Any],
-        record_id: str,
-        structured: dict[str, Any],
-        raw_response: str,
-    ) -> None:
-        payload = {
-            "record_id": record_id,
-            "source_id": row.get("id"),
-            "provider": self.client.provider,
-            "model": self.client.model,
-            "processed_at_utc": datetime.now(timezone.utc).isoformat(),
-            "structured": structured,
-            "raw_response": raw_response,
-        }
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, ensure_ascii=True)
-
-    def _load_response_file(self, path: Path) -> dict[str, Any] | None:
-        try:
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            structured = payload.get("structured")
-            if not isinstance(structured, dict):
-                return None
-            return _normalize_structured_payload(structured)
-        except Exception:
-            return None
+        # One scan of the template; substituted text is never rescanned, so an
+        # abstract containing e.g. "{title}" is left as-is.
+        values = _prompt_values(row)
+        return _PROMPT_TOKEN_RE.sub(lambda match: values[match.group(1)], self.prompt_template)
 
     def _blank_payload(self) -> dict[str, Any]:
         return {field: _default_value(field) for field in STRUCTURED_FIELDS}
@@ -349,8 +667,7 @@ class AbstractStructuringExtractor:
     def _write_failed_llm_log(self, failures: list[dict[str, Any]]) -> None:
         path = self.settings.failed_llm_log_path
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(failures, handle, indent=2, ensure_ascii=True)
+        path.write_bytes(orjson.dumps(failures, option=_JSON_WRITE_OPTIONS))
 
 
 def extract_structured_fields(
@@ -360,4 +677,7 @@ def extract_structured_fields(
 ) -> pd.DataFrame:
     """Convenience wrapper for extracting structured fields from abstracts."""
     extractor = AbstractStructuringExtractor(settings=settings)
-    return extractor.extract_dataframe(df=df, on_progress=on_progress)
+    try:
+        return extractor.extract_dataframe(df=df, on_progress=on_progress)
+    finally:
+        extractor.client.close()
@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Callable
 
+import orjson
 import pandas as pd
 
+from .async_utils import run_async
 from .config import Settings
+from .constants import STRUCTURED_FIELDS
 from .doi_resolver import AsyncDOIResolver
 from .ingestion import load_openalex_data
-from .llm_extractor import extract_structured_fields
+from .llm_extractor import AbstractStructuringExtractor
 from .logging_utils import configure_logging
 from .preprocess import preprocess_records
+from .writers import write_outputs
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +30,7 @@ LOGGER = logging.getLogger(__name__)
 class PipelineResult:
     run_id: str
     final_dataframe: pd.DataFrame
-    output_csv: Path
+    output_csv: Path | None
     output_parquet: Path
     run_metadata: Path
 
@@ -36,40 +39,13 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _ensure_serializable(value: Any) -> Any:
-    if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=True, sort_keys=True)
-    return value
-
-
-def _serialize_complex_columns(df: pd.DataFrame) -> pd.DataFrame:
-    serializable = df.copy()
-    for col in serializable.columns:
-        if serializable[col].apply(lambda v: isinstance(v, (dict, list))).any():
-            serializable[col] = serializable[col].apply(_ensure_serializable)
-    return serializable
-
-
-def _run_async(coro: Any) -> Any:
-    try:
-        return asyncio.run(coro)
-    except RuntimeError as exc:
-        # Supports environments where an event loop is already active.
-        if "asyncio.run() cannot be called from a running event loop" not in str(exc):
-            raise
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
-
-
 def run_pipeline(
     input_path: str | Path,
     *,
     output_dir: str | Path | None = None,
     llm_provider: str | None = None,
     env_file: str | Path | None = None,
+    write_csv: bool | None = None,
     progress_callback: Callable[[str, int, int], None] | None = None,
 ) -> PipelineResult:
     """
@@ -85,14 +61,18 @@ def run_pipeline(
         Optional provider override (`gemini` or `openai`).
     env_file:
         Optional .env location.
+    write_csv:
+        Optional override for also writing a CSV copy next to the Parquet output.
     progress_callback:
         Callback receiving `(stage, completed, total)`.
     """
     settings = Settings.from_env(env_file=env_file)
     if output_dir is not None:
-        settings.output_dir = Path(output_dir)
+        settings = replace(settings, output_dir=Path(output_dir))
     if llm_provider is not None:
-        settings.llm_provider = llm_provider.strip().lower()
+        settings = replace(settings, llm_provider=llm_provider.strip().lower())
+    if write_csv is not None:
+        settings = replace(settings, write_csv=write_csv)
     settings.ensure_directories()
 
     configure_logging(
@@ -113,31 +93,64 @@ def run_pipeline(
 
     if progress_callback:
         progress_callback("preprocess", 0, 1)
-    cleaned = preprocess_records(ingested)
+    cleaned = preprocess_records(ingested, n_jobs=settings.preprocess_workers)
     if progress_callback:
         progress_callback("preprocess", 1, 1)
 
     resolver = AsyncDOIResolver(settings=settings)
-    doi_total = int(cleaned["doi"].fillna("").astype(str).str.strip().replace("", pd.NA).dropna().nunique())
+    # Ingestion leaves DOIs as stripped, non-empty strings or None.
+    doi_total = int(cleaned["doi"].nunique(dropna=True))
     if progress_callback:
         progress_callback("doi", 0, max(1, doi_total))
 
-    enriched = _run_async(
-        resolver.resolve_dataframe(
-            cleaned,
-            on_progress=(
-                (lambda c, t: progress_callback("doi", c, t))
-                if progress_callback
-                else None
-            ),
-        )
-    )
+    extractor = AbstractStructuringExtractor(settings=settings)
 
-    llm_enriched = extract_structured_fields(
-        enriched,
-        settings=settings,
-        on_progress=(lambda c, t: progress_callback("llm", c, t)) if progress_callback else None,
-    )
+    async def _enrich() -> pd.DataFrame:
+        # DOI resolution and LLM extraction share one event loop so the
+        # connection pools warmed here are the ones the real calls reuse.
+        try:
+            await asyncio.gather(resolver.prewarm(), extractor.client.aprewarm())
+            # Prompts only use title/year/type/abstract, so per-row LLM calls do
+            # not depend on DOI metadata and both fan-outs can run concurrently.
+            enriched, extracted = await asyncio.gather(
+                resolver.resolve_dataframe(
+                    cleaned,
+                    on_progress=(
+                        (lambda c, t: progress_callback("doi", c, t))
+                        if progress_callback
+                        else None
+                    ),
+                ),
+                extractor.aextract_dataframe(
+                    cleaned,
+                    on_progress=(lambda c, t: progress_callback("llm", c, t)) if progress_callback else None,
+                ),
+            )
+            # The extractor owns `record_id`, the structured fields and `llm_*`
+            # columns; same-named input columns are replaced, never kept.
+            llm_columns = [
+                col
+                for col in extracted.columns
+                if col not in cleaned.columns
+                or col == "record_id"
+                or col in STRUCTURED_FIELDS
+                or col.startswith("llm_")
+            ]
+            return pd.concat(
+                [
+                    enriched.drop(columns=llm_columns, errors="ignore"),
+                    extracted[llm_columns].set_index(enriched.index),
+                ],
+                axis=1,
+            )
+        finally:
+            await resolver.close()
+            await extractor.client.aclose()
+
+    try:
+        llm_enriched = run_async(_enrich())
+    finally:
+        extractor.client.close()
 
     completed_at = _utc_now_iso()
     llm_enriched["run_id"] = run_id
@@ -146,16 +159,14 @@ def run_pipeline(
     llm_enriched["pipeline_completed_at_utc"] = completed_at
     llm_enriched["pipeline_seed"] = settings.seed
 
-    write_df = _serialize_complex_columns(llm_enriched)
-    output_csv = settings.output_dir / f"final_dataset_{run_id}.csv"
+    output_csv = settings.output_dir / f"final_dataset_{run_id}.csv" if settings.write_csv else None
     output_parquet = settings.output_dir / f"final_dataset_{run_id}.parquet"
-    write_df.to_csv(output_csv, index=False)
-    write_df.to_parquet(output_parquet, index=False)
+    write_outputs(llm_enriched, output_parquet, output_csv)
 
     metadata = {
         "run_id": run_id,
         "input_path": str(input_path),
-        "output_csv": str(output_csv),
+        "output_csv": str(output_csv) if output_csv is not None else None,
         "output_parquet": str(output_parquet),
         "started_at_utc": started_at,
         "completed_at_utc": completed_at,
@@ -172,10 +183,9 @@ def run_pipeline(
         },
     }
     run_metadata_path = settings.logs_dir / f"run_metadata_{run_id}.json"
-    with run_metadata_path.open("w", encoding="utf-8") as handle:
-        json.dump(metadata, handle, indent=2, ensure_ascii=True)
+    run_metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
-    LOGGER.info("Pipeline completed: csv=%s parquet=%s", output_csv, output_parquet)
+    LOGGER.info("Pipeline completed: parquet=%s csv=%s", output_parquet, output_csv)
     return PipelineResult(
         run_id=run_id,
         final_dataframe=llm_enriched,
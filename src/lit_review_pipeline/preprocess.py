@@ -2,22 +2,74 @@
 
 from __future__ import annotations
 
-import re
+import os
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
 
+import ahocorasick
+import numpy as np
 import pandas as pd
 
 from .constants import MANUFACTURING_KEYWORDS
 
-_WHITESPACE_RE = re.compile(r"\s+")
+_TEXT_COLUMNS = ("title", "abstract", "type", "id")
+# Low-cardinality columns are normalized per distinct value. Titles and abstracts
+# are nearly all unique, where factorizing would only add a hashing pass.
+_REPEATED_TEXT_COLUMNS = frozenset({"type"})
+# Minimum rows per worker slice; below it process start-up and pickling cost
+# more than they save.
+PARALLEL_MIN_ROWS = 10_000
+
+
+def _build_keyword_automaton(keywords: tuple[str, ...]) -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# One Aho-Corasick automaton scans each text once, independent of keyword count.
+_MANUFACTURING_AUTOMATON = _build_keyword_automaton(MANUFACTURING_KEYWORDS)
 
 
 def normalize_text(value: str | None) -> str:
     """Normalize textual values to stable, whitespace-collapsed strings."""
-    if value is None:
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):  # None, NaN, NA, NaT
         return ""
-    normalized = unicodedata.normalize("NFKC", str(value)).strip()
-    return _WHITESPACE_RE.sub(" ", normalized)
+    return _normalize_text_nonnull(value if isinstance(value, str) else str(value))
+
+
+def _normalize_text_nonnull(value: str) -> str:
+    """
+    Strictly typed core of `normalize_text`, free of missing-value branches.
+
+    `str.split()` scans for whitespace runs in C and drops leading/trailing
+    ones, so the join collapses and strips in one pass; several times faster
+    than a whitespace regex substitution on abstract-length strings.
+    """
+    return " ".join(unicodedata.normalize("NFKC", value).split())
+
+
+def _normalize_series(series: pd.Series, *, factorize: bool = False) -> pd.Series:
+    """
+    `normalize_text` over a column; missing values become "".
+
+    With `factorize`, only the distinct values are normalized and the results
+    are gathered back by code.
+    """
+    values = series.astype(object).fillna("").astype(str).to_numpy()
+    if factorize:
+        codes, uniques = pd.factorize(values)
+        normalized = np.empty(len(uniques), dtype=object)
+        normalized[:] = [_normalize_text_nonnull(value) for value in uniques]
+        return pd.Series(normalized[codes], index=series.index, dtype=object)
+    return pd.Series(
+        [_normalize_text_nonnull(value) for value in values],
+        index=series.index,
+        dtype=object,
+    )
 
 
 def has_manufacturing_context(title: str, abstract: str) -> int:
@@ -26,39 +78,89 @@ def has_manufacturing_context(title: str, abstract: str) -> int:
     return int(any(keyword in combined for keyword in MANUFACTURING_KEYWORDS))
 
 
-def preprocess_records(df: pd.DataFrame) -> pd.DataFrame:
+def preprocess_records(df: pd.DataFrame, *, n_jobs: int = 1) -> pd.DataFrame:
     """
     Clean and enrich records.
 
     - Normalizes text fields
-    - Adds `has_abstract` and `manufacturing_context` binary flags
+    - Adds `has_abstract` and `manufacturing_context` binary (`int8`) flags
+    - Stores `type` as a categorical
     - Drops rows without abstracts
     - Sorts records deterministically
+
+    `df` is never modified. With `n_jobs > 1` (or `-1` for every core),
+    contiguous slices of at least `PARALLEL_MIN_ROWS` rows are cleaned in
+    worker processes and sorted once after concatenation; smaller frames run
+    in-process.
     """
-    records = df.copy()
+    workers = _worker_count(n_jobs, len(df))
+    if workers > 1:
+        bounds = np.linspace(0, len(df), num=workers + 1, dtype=np.int64)
+        slices = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            records = pd.concat(list(pool.map(_clean_records, slices)), ignore_index=True)
+    else:
+        records = _clean_records(df)
+
+    # A handful of publication types repeat on every row; categorize after the
+    # concat so parallel slices do not end up with mismatched categories.
+    records["type"] = records["type"].astype("category")
+
+    sort_columns = [col for col in ("id", "publication_year", "title") if col in records.columns]
+    records = records.sort_values(by=sort_columns, kind="mergesort").reset_index(drop=True)
+    return records
+
+
+def _worker_count(n_jobs: int, rows: int) -> int:
+    """Cap workers so every slice keeps enough rows to amortize process start-up and pickling."""
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, rows // max(1, PARALLEL_MIN_ROWS)))
 
-    for col in ("title", "abstract", "type", "id"):
-        if col not in records.columns:
-            records[col] = ""
-        records[col] = records[col].apply(normalize_text)
 
-    records["has_abstract"] = records["abstract"].apply(lambda x: int(bool(x.strip())))
-    records = records[records["has_abstract"] == 1].copy()
+def _normalized_values(df: pd.DataFrame, col: str) -> np.ndarray:
+    if col not in df.columns:
+        return np.full(len(df), "", dtype=object)
+    return _normalize_series(df[col], factorize=col in _REPEATED_TEXT_COLUMNS).to_numpy()
 
-    records["manufacturing_context"] = records.apply(
-        lambda row: has_manufacturing_context(
-            title=row.get("title", ""),
-            abstract=row.get("abstract", ""),
+
+def _clean_records(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize, filter and flag one frame (or slice) without sorting it.
+
+    The row filter (`take`) is the only full-frame copy; new columns are then
+    set on it directly.
+    """
+    # Text columns are stripped once normalized, so a non-empty string means an
+    # abstract exists. Only the abstract is normalized before filtering; one
+    # NumPy compare builds the mask and converting it to positions once lets the
+    # frame be gathered by index (`take` skips boolean-indexer validation and
+    # returns an independent frame). The other text columns are then normalized
+    # for the surviving rows only.
+    abstracts = _normalized_values(df, "abstract")
+    positions = np.flatnonzero(abstracts != "")
+    records = df.take(positions)
+
+    new_columns: dict[str, Any] = {
+        col: abstracts[positions] if col == "abstract" else _normalized_values(records, col)
+        for col in _TEXT_COLUMNS
+    }
+    new_columns["has_abstract"] = np.ones(len(records), dtype=np.int8)
+    titles, abstracts = new_columns["title"], new_columns["abstract"]
+    new_columns["manufacturing_context"] = np.fromiter(
+        (
+            next(_MANUFACTURING_AUTOMATON.iter(f"{title} {abstract}".lower()), None) is not None
+            for title, abstract in zip(titles, abstracts)
         ),
-        axis=1,
+        dtype=np.int8,
+        count=len(abstracts),
     )
-
     if "publication_year" in records.columns:
-        records["publication_year"] = pd.to_numeric(
+        new_columns["publication_year"] = pd.to_numeric(
             records["publication_year"],
             errors="coerce",
         ).astype("Int64")
+    for col, values in new_columns.items():
+        records[col] = values
 
-    sort_columns = [col for col in ("id", "publication_year", "title") if col in records.columns]
-    records = records.sort_values(by=sort_columns, kind="mergesort").reset_index(drop=True)
     return records
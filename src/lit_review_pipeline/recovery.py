@@ -1,29 +1,34 @@
-"""Failure recovery utilities for LLM extraction."""
+"""Failure recovery utilities for DOI resolution and LLM extraction."""
 
 from __future__ import annotations
 
 import json
 import logging
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from .async_utils import run_async
 from .config import Settings
 from .constants import STRUCTURED_FIELDS
+from .doi_resolver import AsyncDOIResolver
 from .ingestion import load_openalex_data
 from .llm_extractor import attach_record_ids, extract_structured_fields
 from .logging_utils import configure_logging
 from .preprocess import preprocess_records
+from .writers import read_final_dataset, write_outputs
 
 LOGGER = logging.getLogger(__name__)
 
 
-def _latest_final_csv(output_dir: Path) -> Path:
-    candidates = sorted(output_dir.glob("final_dataset_*.csv"), key=lambda p: p.stat().st_mtime)
+def _latest_final_dataset(output_dir: Path) -> Path:
+    candidates = sorted(output_dir.glob("final_dataset_*.parquet"), key=lambda p: p.stat().st_mtime)
     if not candidates:
-        raise FileNotFoundError(f"No final dataset CSV files found in {output_dir}")
+        raise FileNotFoundError(f"No final dataset Parquet files found in {output_dir}")
     return candidates[-1]
 
 
@@ -36,6 +41,49 @@ def _load_failed_record_ids(failed_log_path: Path) -> list[str]:
     return [record_id for record_id in ids if record_id]
 
 
+def _has_failed_dois(failed_log_path: Path) -> bool:
+    return failed_log_path.exists() and failed_log_path.stat().st_size > 0
+
+
+def _resolved_doi_seed(latest_df: pd.DataFrame) -> set[str]:
+    """Collect DOIs already resolved in a previous output whose metadata is on disk."""
+    resolved = latest_df.loc[
+        latest_df["doi_resolved"].fillna(0).astype(int) == 1,
+        ["doi", "doi_metadata_path"],
+    ].dropna()
+    resolved = resolved.drop_duplicates(subset=["doi"])
+    return {
+        str(doi).strip()
+        for doi, path in zip(resolved["doi"], resolved["doi_metadata_path"])
+        if Path(path).exists()
+    }
+
+
+def _recover_failed_dois(latest_df: pd.DataFrame, settings: Settings) -> tuple[pd.DataFrame, int]:
+    """
+    Re-resolve DOIs that failed in `latest_df`.
+
+    Previously resolved DOIs seed the resolver, so only failures hit Crossref.
+    Returns the updated frame and the number of newly resolved rows.
+    """
+    required = {"doi", "doi_resolved", "doi_metadata_path"}
+    if not required.issubset(latest_df.columns):
+        return latest_df, 0
+
+    seed = _resolved_doi_seed(latest_df)
+    previously_resolved = int((latest_df["doi_resolved"].fillna(0).astype(int) == 1).sum())
+
+    async def _resolve() -> pd.DataFrame:
+        resolver = AsyncDOIResolver(settings)
+        try:
+            return await resolver.resolve_dataframe(latest_df, seed_dois=seed)
+        finally:
+            await resolver.close()
+
+    resolved = run_async(_resolve())
+    return resolved, int(resolved["doi_resolved"].sum()) - previously_resolved
+
+
 def recover_failed_rows(
     input_path: str | Path,
     *,
@@ -44,50 +92,64 @@ def recover_failed_rows(
     llm_provider: str | None = None,
 ) -> dict[str, Any]:
     """
-    Re-run failed LLM rows and merge recovered values into the latest final dataset.
+    Re-run failed DOI lookups and LLM rows and merge recovered values into the
+    latest final dataset.
     """
     settings = Settings.from_env(env_file=env_file)
     if output_dir is not None:
-        settings.output_dir = Path(output_dir)
+        settings = replace(settings, output_dir=Path(output_dir))
     if llm_provider is not None:
-        settings.llm_provider = llm_provider.strip().lower()
+        settings = replace(settings, llm_provider=llm_provider.strip().lower())
     settings.ensure_directories()
 
     configure_logging(level=settings.log_level, log_file=settings.logs_dir / "pipeline.log")
 
     failed_ids = _load_failed_record_ids(settings.failed_llm_log_path)
-    if not failed_ids:
-        LOGGER.info("No failed LLM rows to recover.")
+    if not failed_ids and not _has_failed_dois(settings.failed_doi_log_path):
+        LOGGER.info("No failed DOI or LLM rows to recover.")
         return {"recovered_rows": 0, "message": "No failed rows found."}
 
-    source = attach_record_ids(preprocess_records(load_openalex_data(input_path)))
-    latest_csv = _latest_final_csv(settings.output_dir)
-    latest_df = pd.read_csv(latest_csv)
+    latest_path = _latest_final_dataset(settings.output_dir)
+    latest_df = read_final_dataset(latest_path)
 
     if "record_id" not in latest_df.columns:
         raise ValueError("Latest output file does not contain `record_id` column.")
 
-    recover_subset = source[source["record_id"].isin(failed_ids)].copy()
-
-    # If record IDs are unavailable on the source subset, fall back to latest dataset rows.
-    if recover_subset.empty:
-        recover_subset = latest_df[latest_df["record_id"].isin(failed_ids)][
-            [c for c in ("record_id", "id", "title", "abstract", "publication_year", "type") if c in latest_df.columns]
-        ].copy()
-
-    if recover_subset.empty:
+    latest_df, recovered_dois = _recover_failed_dois(latest_df, settings)
+    if recovered_dois:
+        LOGGER.info("Recovered %s DOI rows.", recovered_dois)
+
+    recover_subset = pd.DataFrame()
+    if failed_ids:
+        source = attach_record_ids(
+            preprocess_records(load_openalex_data(input_path), n_jobs=settings.preprocess_workers)
+        )
+        recover_subset = source.take(np.flatnonzero(source["record_id"].isin(failed_ids)))
+
+        # If record IDs are unavailable on the source subset, fall back to latest dataset rows.
+        if recover_subset.empty:
+            prompt_columns = ("record_id", "id", "title", "abstract", "publication_year", "type")
+            recover_subset = latest_df.take(np.flatnonzero(latest_df["record_id"].isin(failed_ids)))[
+                [c for c in prompt_columns if c in latest_df.columns]
+            ]
+
+    if recover_subset.empty and not recovered_dois:
         LOGGER.info("No matching failed rows found in source data.")
         return {"recovered_rows": 0, "message": "No matching failed rows."}
 
-    original_overwrite = settings.overwrite_existing_responses
-    settings.overwrite_existing_responses = True
-    recovered = extract_structured_fields(recover_subset, settings=settings)
-    settings.overwrite_existing_responses = original_overwrite
+    recovered = (
+        extract_structured_fields(
+            recover_subset,
+            settings=replace(settings, overwrite_existing_responses=True),
+        )
+        if not recover_subset.empty
+        else pd.DataFrame(columns=["record_id", "llm_extraction_error"])
+    )
 
     recovered_success = (
-        recovered[recovered["llm_extraction_error"].isna()].copy()
+        recovered.take(np.flatnonzero(recovered["llm_extraction_error"].isna()))
         if "llm_extraction_error" in recovered.columns
-        else recovered.copy()
+        else recovered
     )
     recovered_cols = ["record_id", *STRUCTURED_FIELDS, "llm_provider", "llm_model", "llm_extraction_error"]
     recovered_cols = [c for c in recovered_cols if c in recovered_success.columns]
@@ -95,42 +157,36 @@ def recover_failed_rows(
         recovered_success[recovered_cols].drop_duplicates(subset=["record_id"]).set_index("record_id")
     )
 
-    merged = latest_df.set_index("record_id")
-    merged.update(recovered_patch)
-    merged = merged.reset_index()
-    recovered_record_ids = set(recovered_patch.index.tolist())
-    if recovered_record_ids and "llm_extraction_error" in merged.columns:
-        merged.loc[
-            merged["record_id"].isin(recovered_record_ids),
-            "llm_extraction_error",
-        ] = None
+    # Patch recovered rows in place: align the patch to the masked rows once and
+    # assign each column positionally instead of a set_index/update round-trip.
+    merged = latest_df
+    mask = merged["record_id"].isin(recovered_patch.index).to_numpy()
+    if mask.any():
+        patch = recovered_patch.reindex(merged.loc[mask, "record_id"].to_numpy())
+        for col in patch.columns:
+            merged.loc[mask, col] = patch[col].to_numpy()
+        merged.loc[mask, "llm_extraction_error"] = None
     merged["recovery_applied_at_utc"] = datetime.now(timezone.utc).isoformat()
 
-    for col in merged.columns:
-        if merged[col].apply(lambda v: isinstance(v, (dict, list))).any():
-            merged[col] = merged[col].apply(
-                lambda v: json.dumps(v, ensure_ascii=True, sort_keys=True)
-                if isinstance(v, (dict, list))
-                else v
-            )
-
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    recovered_csv = settings.output_dir / f"final_dataset_{stamp}_recovered.csv"
+    recovered_csv = (
+        settings.output_dir / f"final_dataset_{stamp}_recovered.csv" if settings.write_csv else None
+    )
     recovered_parquet = settings.output_dir / f"final_dataset_{stamp}_recovered.parquet"
-    merged.to_csv(recovered_csv, index=False)
-    merged.to_parquet(recovered_parquet, index=False)
+    write_outputs(merged, recovered_parquet, recovered_csv)
 
     report = {
         "failed_rows_requested": int(len(failed_ids)),
         "rows_retried": int(len(recover_subset)),
         "recovered_rows": int(len(recovered_patch)),
-        "source_latest_csv": str(latest_csv),
-        "output_csv": str(recovered_csv),
+        "recovered_doi_rows": int(recovered_dois),
+        "source_dataset": str(latest_path),
+        "output_csv": str(recovered_csv) if recovered_csv is not None else None,
         "output_parquet": str(recovered_parquet),
     }
     report_path = settings.logs_dir / f"recovery_report_{stamp}.json"
     with report_path.open("w", encoding="utf-8") as handle:
         json.dump(report, handle, indent=2, ensure_ascii=True)
 
-    LOGGER.info("Recovered %s rows. Output: %s", len(recovered_patch), recovered_csv)
+    LOGGER.info("Recovered %s rows. Output: %s", len(recovered_patch), recovered_parquet)
     return report
@@ -0,0 +1,89 @@
+"""Final dataset writers (and the matching reader used by recovery)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import orjson
+import pandas as pd
+import polars as pl
+
+# Shared by Parquet row groups and Polars' streaming engine. The streaming
+# default (a few thousand rows) makes `sink_parquet` emit tiny morsels and is
+# an order of magnitude slower than collecting first, so raise it up front in
+# case any writer moves to lazy/streaming sinks; pass `row_group_size`
+# explicitly there too.
+ROW_GROUP_SIZE = 100_000
+pl.Config.set_streaming_chunk_size(ROW_GROUP_SIZE)
+
+
+_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _is_null_or_string_list(value: Any) -> bool:
+    if value is None or (isinstance(value, float) and value != value):
+        return True
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def serialize_complex_columns(df: pd.DataFrame, *, native_lists: bool = False) -> pd.DataFrame:
+    """
+    Return a frame whose dict/list cells are JSON strings (sorted keys).
+
+    Only object columns can hold containers, and each is scanned once: the
+    rewrite starts at the first container found, if any. With `native_lists`,
+    columns holding only lists of strings (or nulls) are kept as lists so
+    Parquet can store them as `list<string>`.
+    """
+    serializable = df.copy(deep=False)
+    for col in serializable.select_dtypes(include=["object"]).columns:
+        values = serializable[col].to_numpy()
+        if not any(isinstance(value, (dict, list)) for value in values):
+            continue
+        if native_lists and all(_is_null_or_string_list(value) for value in values):
+            continue
+        serializable[col] = [
+            orjson.dumps(value, option=_JSON_OPTIONS).decode()
+            if isinstance(value, (dict, list))
+            else value
+            for value in values
+        ]
+    return serializable
+
+
+def write_csv(df: pd.DataFrame, output_csv: Path) -> None:
+    """Write `df` as CSV with list/dict cells flattened to JSON strings."""
+    pl.from_pandas(serialize_complex_columns(df)).write_csv(output_csv)
+
+
+def write_outputs(df: pd.DataFrame, output_parquet: Path, output_csv: Path | None = None) -> None:
+    """
+    Write the final dataset to Parquet and, optionally, CSV with Polars' writers.
+
+    Parquet keeps string-list columns native (`list<string>`), so the JSON
+    flattening pass only runs for columns with mixed or nested values, and the
+    CSV pass only when a CSV path is given.
+    """
+    frame = pl.from_pandas(serialize_complex_columns(df, native_lists=True)).rechunk()
+    frame.write_parquet(
+        output_parquet,
+        compression="zstd",
+        row_group_size=ROW_GROUP_SIZE,
+        use_pyarrow=False,
+    )
+    if output_csv is not None:
+        write_csv(df, output_csv)
+
+
+def read_final_dataset(path: Path) -> pd.DataFrame:
+    """Read a final dataset, turning Parquet list cells back into Python lists."""
+    if path.suffix.lower() == ".csv":
+        return pd.read_csv(path)
+    df = pd.read_parquet(path)
+    for col in df.select_dtypes(include=["object"]).columns:
+        values = df[col].to_numpy()
+        if any(isinstance(value, np.ndarray) for value in values):
+            df[col] = [value.tolist() if isinstance(value, np.ndarray) else value for value in values]
+    return df
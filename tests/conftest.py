@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from lit_review_pipeline import llm_extractor
+from lit_review_pipeline.clients import BaseLLMClient
+from lit_review_pipeline.config import Settings
+
+
+def _default_response(prompt: str) -> str:
+    return json.dumps({"concise_summary": "summary", "use_cases": ["qc"]})
+
+
+class StubLLMClient(BaseLLMClient):
+    """In-memory provider that records prompts and answers them with `respond`."""
+
+    def __init__(self, respond: Callable[[str], str] = _default_response) -> None:
+        self.respond = respond
+        self.batch_capable = False
+        self.prompts: list[str] = []
+
+    @property
+    def provider(self) -> str:
+        return "stub"
+
+    @property
+    def model(self) -> str:
+        return "stub-model"
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.batch_capable
+
+    def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return self.respond(prompt)
+
+    async def agenerate(self, prompt: str) -> str:
+        return self.generate(prompt)
+
+    def generate_batch(self, prompts: list[str]) -> list[str | Exception]:
+        results: list[str | Exception] = []
+        for prompt in prompts:
+            try:
+                results.append(self.generate(prompt))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    """Defaults with every output under `tmp_path` and a `{title}|{abstract}` prompt."""
+    template = tmp_path / "prompt.txt"
+    template.write_text("{title}|{abstract}", encoding="utf-8")
+    settings = replace(
+        Settings.from_env(env_file=tmp_path / "missing.env"),
+        output_dir=tmp_path / "output",
+        prompt_template_path=template,
+    )
+    settings.ensure_directories()
+    return settings
+
+
+@pytest.fixture
+def stub_client(monkeypatch: pytest.MonkeyPatch) -> StubLLMClient:
+    """A `StubLLMClient` returned by `create_llm_client` for the duration of the test."""
+    client = StubLLMClient()
+    monkeypatch.setattr(llm_extractor, "create_llm_client", lambda settings: client)
+    return client
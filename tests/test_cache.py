@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from lit_review_pipeline.cache import CrossrefCache, LLMResponseCache, LLMResponseStore
+from lit_review_pipeline.clients import CachedLLMClient
+
+
+def test_crossref_cache_round_trip_and_ttl(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "crossref.sqlite"
+    with CrossrefCache(path, ttl_seconds=3600) as cache:
+        cache.put_many({"10.1/abc": {"title": ["Paper"]}})
+        assert cache.get_many(["10.1/abc", "10.1/missing"]) == {"10.1/abc": {"title": ["Paper"]}}
+
+    with CrossrefCache(path, ttl_seconds=0) as expired:
+        assert expired.get_many(["10.1/abc"]) == {}
+
+
+def test_cached_llm_client_replays_identical_prompts(tmp_path: Path, stub_client) -> None:
+    stub_client.respond = lambda prompt: f"echo:{prompt}"
+    client = CachedLLMClient(stub_client, LLMResponseCache(tmp_path / "llm.sqlite"), temperature=0.0)
+    assert client.generate("p") == "echo:p"
+    assert client.generate("p") == "echo:p"
+    assert stub_client.prompts == ["p"]
+    client.close()
+
+
+def test_llm_response_store_round_trip_and_record_index(tmp_path: Path) -> None:
+    path = tmp_path / "llm_responses.sqlite"
+    with LLMResponseStore(path) as store:
+        store.put(
+            "key1",
+            {"concise_summary": "s"},
+            record_id="A",
+            source_id="W1",
+            provider="stub",
+            model="m",
+            raw_response='{"concise_summary": "s"}',
+        )
+        store.index_records({"A": "key1", "B": "key1"})
+
+    with LLMResponseStore(path) as reopened:
+        assert reopened.get("key1") == {"concise_summary": "s"}
+        assert reopened.get("missing") is None
+        assert reopened.response_keys_for(["A", "B", "C"]) == {"A": "key1", "B": "key1"}
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pandas as pd
+import pytest
+
+from lit_review_pipeline.cache import CrossrefCache
+from lit_review_pipeline.doi_resolver import AsyncDOIResolver, doi_metadata_path, load_doi_metadata
+
+
+def test_resolve_dataframe_skips_network_for_seeded_dois(settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_network(*args, **kwargs):
+        raise AssertionError("seeded DOIs must not open an HTTP session")
+
+    monkeypatch.setattr(aiohttp, "ClientSession", _no_network)
+    df = pd.DataFrame({"doi": ["10.1/a", " 10.1/a ", ""]})
+
+    result = asyncio.run(AsyncDOIResolver(settings).resolve_dataframe(df, seed_dois={"10.1/a"}))
+
+    expected_path = str(doi_metadata_path(settings.doi_metadata_dir, "10.1/a"))
+    assert result["doi_resolved"].tolist() == [1, 1, 0]
+    assert result["doi_metadata_path"].tolist() == [expected_path, expected_path, None]
+
+
+def test_cached_metadata_is_persisted_to_sidecar_files(settings) -> None:
+    with CrossrefCache(settings.crossref_cache_path, ttl_seconds=settings.doi_cache_ttl_days * 86400) as cache:
+        cache.put_many({"10.1/b": {"title": ["Cached"]}})
+
+    result = asyncio.run(AsyncDOIResolver(settings).resolve_dataframe(pd.DataFrame({"doi": ["10.1/b"]})))
+
+    assert result["doi_resolved"].tolist() == [1]
+    assert "doi_metadata" not in result.columns
+    assert load_doi_metadata("10.1/b", settings.doi_metadata_dir) == {"title": ["Cached"]}
+    assert load_doi_metadata("10.1/missing", settings.doi_metadata_dir) is None
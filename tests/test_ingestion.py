@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from lit_review_pipeline.ingestion import load_openalex_data
+
+
+def test_json_inverted_index_is_rebuilt_into_abstract(tmp_path: Path) -> None:
+    path = tmp_path / "export.json"
+    payload = {
+        "results": [
+            {"id": "W1", "title": "t1", "abstract_inverted_index": {"factories": [2], "AI": [0], "in": [1]}},
+            {"id": "W2", "title": "t2", "abstract_inverted_index": None, "doi": "https://doi.org/10.1/b"},
+            {"id": "W3", "title": "t3", "doi": "https://doi.org/doi:10.1/c"},
+            {"id": "W4", "title": "t4", "doi": " DOI: 10.1/d"},
+        ]
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    df = load_openalex_data(path)
+
+    assert df["abstract"].tolist() == ["AI in factories", "", "", ""]
+    assert df["doi"].tolist() == [None, "10.1/b", "10.1/c", "10.1/d"]
+    assert not any(column.startswith("abstract_inverted_index.") for column in df.columns)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from lit_review_pipeline.clients.key_pool import APIKeyPool
+
+
+def test_key_pool_reports_wait_until_a_key_leaves_cooldown() -> None:
+    pool = APIKeyPool(["key-a", "key-b"])
+    assert pool.seconds_until_available() == 0
+
+    pool.cooldown("key-a", 30)
+    assert pool.seconds_until_available() == 0
+    assert pool.next_key() == "key-b"
+
+    pool.cooldown("key-b", 10)
+    assert 9 < pool.seconds_until_available() <= 10
+    assert pool.next_key() == "key-b"
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+
+from lit_review_pipeline import llm_extractor
+from lit_review_pipeline.cache import LLMResponseStore
+from lit_review_pipeline.writers import read_final_dataset, write_outputs
+
+
+def _records(titles: list[str], abstracts: list[str]) -> pd.DataFrame:
+    ids = [chr(ord("A") + i) for i in range(len(titles))]
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "title": titles,
+            "abstract": abstracts,
+            "publication_year": [2022] * len(titles),
+            "type": ["article"] * len(titles),
+        }
+    )
+
+
+def test_extract_dataframe_runs_rows_concurrently(settings, stub_client) -> None:
+    result = llm_extractor.extract_structured_fields(_records(["t1", "t2"], ["a1", "a2"]), settings=settings)
+
+    assert result["record_id"].tolist() == ["A", "B"]
+    assert result["concise_summary"].tolist() == ["summary", "summary"]
+    assert result["llm_extraction_error"].isna().all()
+    assert sorted(stub_client.prompts) == ["t1|a1", "t2|a2"]
+
+
+def test_extract_dataframe_batch_mode_maps_results_back_to_rows(settings, stub_client) -> None:
+    def respond(prompt: str) -> str:
+        if "t2" in prompt:
+            raise ValueError("batch item failed")
+        return json.dumps({"concise_summary": "summary"})
+
+    stub_client.respond = respond
+    stub_client.batch_capable = True
+    settings = replace(settings, llm_batch_mode=True)
+
+    result = llm_extractor.extract_structured_fields(_records(["t1", "t2"], ["a1", "a2"]), settings=settings)
+
+    assert result["concise_summary"].tolist() == ["summary", None]
+    assert result["llm_extraction_error"].tolist() == [None, "batch item failed"]
+
+
+def test_identical_rows_share_one_stored_response(settings, stub_client) -> None:
+    df = _records(["t1", "t1"], ["a1", "a1"])
+
+    first = llm_extractor.extract_structured_fields(df, settings=settings)
+    second = llm_extractor.extract_structured_fields(df, settings=settings)
+
+    assert stub_client.prompts == ["t1|a1"]
+    assert first["concise_summary"].tolist() == second["concise_summary"].tolist() == ["summary", "summary"]
+    with LLMResponseStore(settings.llm_response_store_path) as store:
+        index = store.response_keys_for(["A", "B"])
+    assert index["A"] == index["B"]
+
+
+def _marshaling_response(prompt: str) -> str:
+    if not prompt.startswith("BATCH"):
+        return json.dumps({"concise_summary": "single"})
+    records = json.loads(prompt.removeprefix("BATCH"))
+    # Drop the last record to exercise the single-row fallback.
+    return json.dumps([{"record_id": r["record_id"], "concise_summary": "batched"} for r in records[:-1]])
+
+
+def test_rows_per_prompt_marshals_rows_and_retries_missing_ones(
+    tmp_path: Path, settings, stub_client
+) -> None:
+    stub_client.respond = _marshaling_response
+    batch_template = tmp_path / "batch_prompt.txt"
+    batch_template.write_text("BATCH{records}", encoding="utf-8")
+    settings = replace(settings, llm_rows_per_prompt=3, batch_prompt_template_path=batch_template)
+
+    result = llm_extractor.extract_structured_fields(
+        _records(["t0", "t1", "t2"], ["a0", "a1", "a2"]), settings=settings
+    )
+
+    assert result["concise_summary"].tolist() == ["batched", "batched", "single"]
+    assert len(stub_client.prompts) == 2
+
+
+def test_editing_batch_template_misses_the_response_store(tmp_path: Path, settings, stub_client) -> None:
+    stub_client.respond = _marshaling_response
+    batch_template = tmp_path / "batch_prompt.txt"
+    batch_template.write_text("BATCH{records}", encoding="utf-8")
+    settings = replace(settings, llm_rows_per_prompt=2, batch_prompt_template_path=batch_template)
+    df = _records(["t0", "t1"], ["a0", "a1"])
+
+    llm_extractor.extract_structured_fields(df, settings=settings)
+    batch_template.write_text("BATCH {records}", encoding="utf-8")
+    llm_extractor.extract_structured_fields(df, settings=settings)
+
+    assert [p.startswith("BATCH ") for p in stub_client.prompts if p.startswith("BATCH")] == [False, True]
+
+
+def test_mixed_type_payloads_are_coerced_and_written_to_parquet(tmp_path: Path, settings, stub_client) -> None:
+    payloads = {
+        "t0": {"confidence_score": "high", "business_function": 7, "use_cases": "qc"},
+        "t1": {"confidence_score": "0.8", "business_function": "Quality", "use_cases": ["qc", 2, None]},
+        "t2": {"confidence_score": 1, "business_function": None, "use_cases": None},
+    }
+    stub_client.respond = lambda prompt: json.dumps(payloads[prompt.split("|")[0]])
+
+    result = llm_extractor.extract_structured_fields(
+        _records(["t0", "t1", "t2"], ["a0", "a1", "a2"]), settings=settings
+    )
+    output_parquet = tmp_path / "final.parquet"
+    write_outputs(result, output_parquet)
+
+    restored = read_final_dataset(output_parquet)
+    assert restored["confidence_score"].tolist()[1:] == [0.8, 1.0]
+    assert pd.isna(restored["confidence_score"].iloc[0])
+    assert restored["business_function"].tolist() == ["7", "Quality", None]
+    assert restored["use_cases"].tolist() == [["qc"], ["qc", "2"], []]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+
+import pytest
+import requests
+
+from lit_review_pipeline.clients import OpenAIClient
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict) -> None:
+        self.status_code = 200
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_generate_batch_cancels_and_raises_after_timeout(settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    posted: list[str] = []
+
+    def post(self, url, **kwargs):
+        posted.append(url)
+        if url.endswith("/files"):
+            return _FakeResponse({"id": "file-1"})
+        return _FakeResponse({"id": "batch-1", "status": "in_progress"})
+
+    def get(self, url, **kwargs):
+        return _FakeResponse({"id": "batch-1", "status": "in_progress"})
+
+    monkeypatch.setattr(requests.Session, "post", post)
+    monkeypatch.setattr(requests.Session, "get", get)
+    settings = replace(
+        settings,
+        openai_api_keys=("sk-test",),
+        llm_batch_poll_seconds=0.0,
+        llm_batch_timeout_seconds=0.0,
+    )
+
+    with pytest.raises(TimeoutError, match="batch-1"):
+        OpenAIClient(settings).generate_batch(["p1", "p2"])
+
+    assert posted[-1].endswith("/batches/batch-1/cancel")
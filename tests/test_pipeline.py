@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lit_review_pipeline.config import Settings
+from lit_review_pipeline.doi_resolver import AsyncDOIResolver
+from lit_review_pipeline.pipeline import run_pipeline
+
+
+def test_pipeline_replaces_input_record_ids_and_llm_columns(
+    tmp_path: Path, settings, stub_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PROMPT_TEMPLATE_PATH", str(settings.prompt_template_path))
+    # The `settings` fixture already cached `from_env` for this env file.
+    Settings.clear_env_cache()
+    monkeypatch.setattr(AsyncDOIResolver, "PREWARM_URL", "http://127.0.0.1:9/")
+    records = [
+        {
+            "id": f"https://openalex.org/W{i}",
+            "record_id": "x y",
+            "title": f"Paper {i}",
+            "abstract": f"Abstract {i}",
+            "publication_year": 2024,
+            "type": "article",
+            "concise_summary": "stale",
+        }
+        for i in (1, 2)
+    ]
+    input_path = tmp_path / "input.json"
+    input_path.write_text(json.dumps({"results": records}), encoding="utf-8")
+
+    result = run_pipeline(input_path, output_dir=tmp_path / "run", env_file=tmp_path / "missing.env")
+
+    final = result.final_dataframe
+    assert final["record_id"].tolist() == ["x_y__1", "x_y__2"]
+    assert final["concise_summary"].tolist() == ["summary", "summary"]
+    assert list(final.columns).count("record_id") == 1
@@ -2,51 +2,101 @@ from __future__ import annotations
 
 import pandas as pd
 
+from lit_review_pipeline import preprocess
 from lit_review_pipeline.llm_extractor import attach_record_ids
 from lit_review_pipeline.preprocess import normalize_text, preprocess_records
 
 
 def test_normalize_text_collapses_whitespace() -> None:
     assert normalize_text("  a\tb\n c  ") == "a b c"
+    assert normalize_text(["a", "b"]) == "['a', 'b']"
+    assert normalize_text(pd.NA) == normalize_text(float("nan")) == normalize_text(None) == ""
 
 
 def test_preprocess_filters_missing_abstract_and_flags_context() -> None:
     df = pd.DataFrame(
-        [
-            {
-                "id": "A",
-                "title": "AI for manufacturing quality control",
-                "abstract": "We optimize factory operations.",
-                "doi": "10.1/abc",
-                "publication_year": 2024,
-                "type": "article",
-            },
-            {
-                "id": "B",
-                "title": "No abstract record",
-                "abstract": "",
-                "doi": None,
-                "publication_year": 2023,
-                "type": "article",
-            },
-        ]
+        {
+            "id": ["A", "B"],
+            "title": ["AI for manufacturing quality control", "No abstract record"],
+            "abstract": ["We optimize factory operations.", ""],
+            "doi": ["10.1/abc", None],
+            "publication_year": [2024, 2023],
+            "type": ["article", "article"],
+        }
     )
 
+    original = df.copy()
     processed = preprocess_records(df)
+    pd.testing.assert_frame_equal(df, original)
     assert len(processed) == 1
     row = processed.iloc[0]
     assert row["id"] == "A"
     assert row["has_abstract"] == 1
     assert row["manufacturing_context"] == 1
+    assert processed["type"].dtype == "category"
+
+
+def test_preprocess_is_idempotent_on_categorical_type() -> None:
+    df = pd.DataFrame(
+        {
+            "id": ["A", "B"],
+            "title": ["Factory  AI", "Other"],
+            "abstract": ["Line balancing", "Supply chains"],
+            "doi": [None, None],
+            "publication_year": [2024, 2023],
+            "type": pd.Categorical(["article", None]),
+        }
+    )
+
+    once = preprocess_records(df)
+    pd.testing.assert_frame_equal(preprocess_records(once), once)
+    assert once["type"].tolist() == ["article", ""]
 
 
 def test_attach_record_ids_is_deterministic() -> None:
     df = pd.DataFrame(
-        [
-            {"id": "A", "title": "t1", "abstract": "a1", "publication_year": 2022, "type": "article"},
-            {"id": "B", "title": "t2", "abstract": "a2", "publication_year": 2023, "type": "article"},
-        ]
+        {
+            "id": ["A", "B"],
+            "title": ["t1", "t2"],
+            "abstract": ["a1", "a2"],
+            "publication_year": [2022, 2023],
+            "type": ["article", "article"],
+        }
     )
     first = attach_record_ids(df)["record_id"].tolist()
+    assert "record_id" not in df.columns
     second = attach_record_ids(df)["record_id"].tolist()
     assert first == second
+
+
+def test_parallel_preprocess_matches_serial(monkeypatch) -> None:
+    monkeypatch.setattr(preprocess, "PARALLEL_MIN_ROWS", 0)
+    rows = range(40)
+    df = pd.DataFrame(
+        {
+            "id": [f"W{i % 7}" for i in rows],
+            "title": [f"Title  {i}" for i in rows],
+            "abstract": ["" if i % 5 == 0 else f"factory  study {i}" for i in rows],
+            "publication_year": [2000 + i % 3 for i in rows],
+            "type": ["article"] * len(rows),
+        }
+    )
+
+    pd.testing.assert_frame_equal(preprocess_records(df, n_jobs=3), preprocess_records(df))
+
+
+def test_manufacturing_context_is_case_insensitive_and_spans_title_and_abstract() -> None:
+    df = pd.DataFrame(
+        {
+            "id": ["A", "B", "C"],
+            "title": ["FACTORY scheduling", "Supply", "Language models"],
+            "abstract": ["We schedule jobs.", "chain risk in retail.", "We study chat assistants."],
+            "publication_year": [2024, 2024, 2024],
+            "type": ["article", "article", "article"],
+        }
+    )
+
+    processed = preprocess_records(df)
+
+    assert processed["manufacturing_context"].tolist() == [1, 1, 0]
+    assert processed["manufacturing_context"].dtype == "int8"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from lit_review_pipeline.clients import rate_limiter
+from lit_review_pipeline.clients.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    """Stands in for the `time` module: `sleep` advances `monotonic` instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.slept += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_rate_limiter_reserves_until_budget_is_spent(clock: _FakeClock) -> None:
+    limiter = RateLimiter(rpm=2, tpm=1_000)
+
+    limiter.acquire(400)
+    limiter.acquire(400)
+    assert clock.slept == 0
+    # Request budget is exhausted: a third call must wait roughly 30 s for one refill.
+    limiter.acquire(10)
+    assert 29 < clock.slept <= 30
+
+
+def test_rate_limiter_token_budget_blocks_large_prompts(clock: _FakeClock) -> None:
+    limiter = RateLimiter(rpm=0, tpm=600)
+
+    limiter.acquire(500)
+    assert clock.slept == 0
+    limiter.acquire(200)
+    assert clock.slept > 0
+
+    unlimited = RateLimiter(rpm=0, tpm=0)
+    before = clock.slept
+    unlimited.acquire(10**9)
+    assert not unlimited.enabled and clock.slept == before
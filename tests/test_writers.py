@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+from lit_review_pipeline.writers import read_final_dataset, write_outputs
+
+
+def test_parquet_keeps_string_lists_native_and_csv_is_optional(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "record_id": ["a", "b"],
+            "use_cases": [["x", "y"], None],
+            "payload": [{"k": 1}, None],
+        }
+    )
+    parquet_path = tmp_path / "final.parquet"
+    write_outputs(df, parquet_path)
+
+    assert not list(tmp_path.glob("*.csv"))
+    assert pl.read_parquet_schema(parquet_path)["use_cases"] == pl.List(pl.String)
+
+    restored = read_final_dataset(parquet_path)
+    assert restored["use_cases"].tolist() == [["x", "y"], None]
+    assert restored["payload"].tolist() == ['{"k":1}', None]
+
+    csv_path = tmp_path / "final.csv"
+    write_outputs(df, parquet_path, csv_path)
+    assert pd.read_csv(csv_path)["use_cases"].tolist()[0] == '["x","y"]'